@@ -2,6 +2,7 @@
 
 import asyncio
 import os
+import sys
 from collections.abc import Iterable
 from pathlib import Path
 
@@ -10,6 +11,7 @@ from textual.app import App, ComposeResult, SystemCommand
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
 from textual.screen import ModalScreen, Screen
+from textual.timer import Timer
 from textual.widgets import Button, Footer, Header, Input, Label, Select, Static, Switch
 from textual.worker import Worker, WorkerState
 
@@ -39,6 +41,25 @@ except ImportError:
     HAS_SLIDECONTAINER = False
 
 
+def _use_pidfd_child_watcher() -> None:
+    """Reap yt-dlp/ffmpeg subprocesses through pidfds on Linux.
+
+    Python 3.11's default ThreadedChildWatcher parks a thread in waitpid()
+    for every child; a pidfd is just another fd on the event loop. 3.12+
+    already picks pidfds by default (and deprecates child watchers), and
+    pidfd_open needs Linux >= 5.3. Must be called with the loop running.
+    """
+    if sys.version_info >= (3, 12) or sys.platform != "linux":
+        return
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except (AttributeError, OSError):
+        return
+    watcher = asyncio.PidfdChildWatcher()
+    watcher.attach_loop(asyncio.get_running_loop())
+    asyncio.set_child_watcher(watcher)
+
+
 class QuitConfirmScreen(ModalScreen[bool]):
     """Modal screen for confirming app exit."""
 
@@ -714,11 +735,12 @@ class VideoDetailScreen(ModalScreen[None]):
             # Try to get highest quality thumbnail URL
             thumbnail_url = get_best_thumbnail_url(meta.thumbnail_url)
             
-            # Check cache first
-            image = cache.get(thumbnail_url)
+            # Check cache first; decoding an image is blocking work, keep it
+            # off the event loop
+            image = await asyncio.to_thread(cache.get, thumbnail_url)
             if image is None and thumbnail_url != meta.thumbnail_url:
                 # Try original URL in cache
-                image = cache.get(meta.thumbnail_url)
+                image = await asyncio.to_thread(cache.get, meta.thumbnail_url)
             
             if image is None:
                 # Not cached, fetch from network
@@ -733,7 +755,9 @@ class VideoDetailScreen(ModalScreen[None]):
                         response = await client.get(thumbnail_url, timeout=10.0)
                     
                     response.raise_for_status()
-                    image = cache.process_and_save(thumbnail_url, response.content)
+                    image = await asyncio.to_thread(
+                        cache.process_and_save, thumbnail_url, response.content
+                    )
             
             # Replace placeholder with actual image - check if screen still mounted
             try:
@@ -802,7 +826,7 @@ class DLVideoApp(App):
         self.initial_url = initial_url
         self._config_manager = ConfigManager()
         self._config = self._config_manager.load()
-        self._history_manager = HistoryManager()
+        self._history_manager = HistoryManager(on_save_error=self._on_history_save_error)
         self._slugifier = Slugifier()
         self._last_output_path: Path | None = None
         self._last_upload_url: str | None = None
@@ -814,6 +838,12 @@ class DLVideoApp(App):
         self._jobs: dict[str, Job] = {}
         self._job_workers: dict[str, Worker] = {}
         self._job_services: dict[str, dict] = {}  # Services per job for cancellation
+        
+        # Warms the metadata cache for URLs entered in the input form. Its
+        # lookups must match the job's get_metadata call (same cookies
+        # browser, full metadata) or the job never gets a cache hit
+        self._prefetcher = VideoDownloader()
+        self._prefetch_timer: Timer | None = None
 
     def _create_container_service(self) -> ContainerService:
         """Create ContainerService with config settings and environment override.
@@ -855,6 +885,7 @@ class DLVideoApp(App):
         yield Footer()
 
     def on_mount(self) -> None:
+        _use_pidfd_child_watcher()
         log_panel = self.query_one(LogHistoryPanel)
         log_panel.log_info("Welcome to dl-video!")
         log_panel.log_info("Enter a video URL and press Enter. You can queue multiple downloads.")
@@ -888,16 +919,19 @@ class DLVideoApp(App):
         from dl_video.utils.thumbnail_cache import ThumbnailCache, get_best_thumbnail_url
         
         cache = ThumbnailCache()
+        # A few at a time: fetches overlap, and Pillow releases the GIL so
+        # the worker threads decode and resize in parallel
+        limit = asyncio.Semaphore(4)
         
-        async with httpx.AsyncClient(follow_redirects=True) as client:
-            for url in urls:
-                # Get best quality URL
-                thumbnail_url = get_best_thumbnail_url(url)
-                
-                # Skip if already cached
-                if cache.has(thumbnail_url) or cache.has(url):
-                    continue
-                
+        async def preload(client: httpx.AsyncClient, url: str) -> None:
+            # Get best quality URL
+            thumbnail_url = get_best_thumbnail_url(url)
+            
+            # Skip if already cached
+            if cache.has(thumbnail_url) or cache.has(url):
+                return
+            
+            async with limit:
                 try:
                     response = await client.get(thumbnail_url, timeout=10.0)
                     
@@ -907,12 +941,20 @@ class DLVideoApp(App):
                         response = await client.get(thumbnail_url, timeout=10.0)
                     
                     if response.status_code != 200:
-                        continue
+                        return
                     
-                    cache.process_and_save(thumbnail_url, response.content)
+                    # Decode, resize and encode in a thread so a burst of
+                    # history thumbnails doesn't stall the UI on startup
+                    await asyncio.to_thread(
+                        cache.process_and_save, thumbnail_url, response.content
+                    )
                 except Exception:
                     # Silently skip failed thumbnails
                     pass
+        
+        async with httpx.AsyncClient(follow_redirects=True) as client:
+            # Deduplicated so no two workers ever write the same cache file
+            await asyncio.gather(*(preload(client, url) for url in dict.fromkeys(urls)))
 
     def get_system_commands(self, screen: Screen) -> Iterable[SystemCommand]:
         yield from super().get_system_commands(screen)
@@ -943,10 +985,20 @@ class DLVideoApp(App):
                 pass
 
     def action_quit(self) -> None:
+        self._prefetcher.cancel_prefetch()
         self._cancel_all_jobs()
         self._save_config()
         self.exit()
 
+    async def on_unmount(self) -> None:
+        """Write pending history and close pooled upload connections."""
+        await self._history_manager.flush()
+        await FileUploader.aclose()
+
+    def _on_history_save_error(self, error: OSError) -> None:
+        """Report a failed background write of the history file."""
+        self.notify(f"Could not save history: {error}", severity="error")
+
     def action_maybe_quit(self) -> None:
         """Show quit confirmation dialog."""
         self.push_screen(QuitConfirmScreen(), self._handle_quit_response)
@@ -1044,6 +1096,25 @@ class DLVideoApp(App):
     def on_input_form_download_requested(self, event: InputForm.DownloadRequested) -> None:
         self._start_job(event.url, event.filename)
 
+    def on_input_form_url_recognized(self, event: InputForm.URLRecognized) -> None:
+        """Prefetch metadata for a recognised URL once typing settles."""
+        if self._prefetch_timer is not None:
+            self._prefetch_timer.stop()
+        url = event.url
+        self._prefetch_timer = self.set_timer(0.5, lambda: self._prefetch_metadata(url))
+
+    def _prefetch_metadata(self, url: str) -> None:
+        """Start warming the metadata cache so the job starts instantly."""
+        # Stops the lookup for the previous URL, so editing the URL doesn't
+        # leave a yt-dlp process behind for every intermediate value
+        self._prefetcher.cancel_prefetch()
+        self._prefetcher.set_cookies_browser(self._config.cookies_browser)
+        self.run_worker(
+            self._prefetcher.prefetch([url]),
+            name="metadata_prefetch",
+            exclusive=False,
+        )
+
     def on_jobs_panel_cancel_requested(self, event: JobsPanel.CancelRequested) -> None:
         self._cancel_job(event.job_id)
         log_panel = self.query_one(LogHistoryPanel)
@@ -1319,11 +1390,18 @@ class DLVideoApp(App):
                     last_time = current_time
                     last_progress = progress
             
+            pending_lines: list[str] = []
+
+            def flush_verbose() -> None:
+                lines = pending_lines.copy()
+                pending_lines.clear()
+                log_panel.log_verbose_lines(lines)
+
             def verbose_output(line: str) -> None:
-                # Schedule UI update on next tick
-                async def _log():
-                    log_panel.log_verbose(line)
-                asyncio.create_task(_log())
+                # Coalesce a burst of lines into one mount on the next tick
+                if not pending_lines:
+                    asyncio.get_running_loop().call_soon(flush_verbose)
+                pending_lines.append(line)
             
             downloaded_path = await downloader.download(
                 job.url, output_path, download_progress, verbose_output
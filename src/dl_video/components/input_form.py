@@ -91,6 +91,13 @@ class InputForm(Container):
             self.filename = filename
             super().__init__()
 
+    class URLRecognized(Message):
+        """Message sent when the URL matches a known video site."""
+
+        def __init__(self, url: str) -> None:
+            self.url = url
+            super().__init__()
+
     def __init__(self, initial_url: str | None = None, url_history: list[str] | None = None) -> None:
         """Initialize the input form.
 
@@ -220,6 +227,7 @@ class InputForm(Container):
             else:
                 validation_label.update("✓ Valid URL")
                 validation_label.add_class("validation-success")
+                self.post_message(self.URLRecognized(url.strip()))
             download_btn.disabled = False
         else:
             validation_label.update(f"✗ {result.message}")
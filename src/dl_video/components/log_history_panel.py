@@ -1,5 +1,7 @@
 """Combined log, history, and settings panel with tabs."""
 
+import re
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -12,6 +14,9 @@ from textual.widgets import Button, Input, Label, Select, Static, Switch, Tabbed
 from dl_video.utils.history import MetadataRecord
 from dl_video.models import Config
 
+# ANSI escape codes in tool output
+ANSI_ESCAPE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
 # Browser options for cookie extraction
 BROWSER_OPTIONS = [
     ("None", ""),
@@ -336,15 +341,24 @@ class LogHistoryPanel(Container):
 
     def log_verbose(self, message: str) -> None:
         """Add a verbose line to the log."""
-        import re
+        self.log_verbose_lines([message])
+
+    def log_verbose_lines(self, messages: Iterable[str]) -> None:
+        """Add several verbose lines to the log with a single mount."""
+        lines = [line for message in messages if (line := self._verbose_line(message))]
+        if not lines:
+            return
+        log_scroll = self.query_one("#log-scroll", VerticalScroll)
+        log_scroll.mount(*lines)
+        lines[-1].scroll_visible()
+
+    def _verbose_line(self, message: str) -> Static | None:
+        """Build the widget for a verbose line, or None if it is blank."""
         # Strip ANSI escape codes
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        message = ansi_escape.sub('', message)
+        message = ANSI_ESCAPE.sub('', message)
         
         if not message.strip():
-            return
-        
-        log_scroll = self.query_one("#log-scroll", VerticalScroll)
+            return None
         
         # Escape Rich markup characters to prevent parsing errors
         safe_message = message.replace("[", r"\[").replace("]", r"\]")
@@ -365,9 +379,7 @@ class LogHistoryPanel(Container):
         else:
             styled = f"[dim]{safe_message}[/dim]"
         
-        line = Static(styled, markup=True, classes="log-line verbose-line")
-        log_scroll.mount(line)
-        line.scroll_visible()
+        return Static(styled, markup=True, classes="log-line verbose-line")
 
     def on_click(self, event) -> None:
         """Handle click on log URL."""
@@ -17,6 +17,20 @@ class OperationState(Enum):
     ERROR = "error"
 
 
+# Built once: a set display of enum members is rebuilt on every evaluation
+ACTIVE_STATES = frozenset({
+    OperationState.FETCHING_METADATA,
+    OperationState.DOWNLOADING,
+    OperationState.CONVERTING,
+    OperationState.UPLOADING,
+})
+TERMINAL_STATES = frozenset({
+    OperationState.COMPLETED,
+    OperationState.CANCELLED,
+    OperationState.ERROR,
+})
+
+
 class BackendType(Enum):
     LOCAL = "local"
     CONTAINER = "container"
@@ -58,20 +72,11 @@ class Job:
 
     @property
     def is_active(self) -> bool:
-        return self.state in {
-            OperationState.FETCHING_METADATA,
-            OperationState.DOWNLOADING,
-            OperationState.CONVERTING,
-            OperationState.UPLOADING,
-        }
+        return self.state in ACTIVE_STATES
 
     @property
     def is_finished(self) -> bool:
-        return self.state in {
-            OperationState.COMPLETED,
-            OperationState.CANCELLED,
-            OperationState.ERROR,
-        }
+        return self.state in TERMINAL_STATES
 
 
 @dataclass
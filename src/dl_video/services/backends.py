@@ -19,6 +19,29 @@ from dl_video.services.errors import (
 )
 
 
+async def iter_lines(
+    stream: asyncio.StreamReader, chunk_size: int = 65536
+) -> AsyncIterator[bytearray]:
+    """Yield lines from a stream, reading it in large chunks.
+
+    yt-dlp can emit thousands of progress lines per second; one read per chunk
+    instead of one readline() per line keeps event loop wakeups down. Partial
+    lines are kept in a growable buffer so a long line spanning many chunks
+    isn't re-copied on every read.
+    """
+    pending = bytearray()
+    while chunk := await stream.read(chunk_size):
+        pending += chunk
+        if b"\n" not in chunk:
+            continue
+        lines = pending.split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line
+    if pending:
+        yield pending
+
+
 class ExecutionBackend(Protocol):
     """Protocol for command execution backends."""
 
@@ -102,15 +125,11 @@ class LocalBackend:
         if self._process.stdout is None:
             return
 
-        while True:
+        async for line in iter_lines(self._process.stdout):
             if self._cancelled:
                 break
 
-            line = await self._process.stdout.readline()
-            if not line:
-                break
-
-            decoded_line = line.decode("utf-8", errors="replace").rstrip("\n\r")
+            decoded_line = line.decode("utf-8", errors="replace").rstrip("\r")
             if progress_callback:
                 progress_callback(decoded_line)
             yield decoded_line
@@ -274,15 +293,11 @@ class PodmanBackend:
         if self._process.stdout is None:
             return
 
-        while True:
+        async for line in iter_lines(self._process.stdout):
             if self._cancelled:
                 break
 
-            line = await self._process.stdout.readline()
-            if not line:
-                break
-
-            decoded_line = line.decode("utf-8", errors="replace").rstrip("\n\r")
+            decoded_line = line.decode("utf-8", errors="replace").rstrip("\r")
             self._output_lines.append(decoded_line)
 
             # Check for error patterns in output
@@ -421,11 +436,8 @@ class PodmanBackend:
         stderr_output = ""
 
         if pull_process.stdout:
-            while True:
-                line = await pull_process.stdout.readline()
-                if not line:
-                    break
-                decoded_line = line.decode("utf-8", errors="replace").rstrip("\n\r")
+            async for line in iter_lines(pull_process.stdout):
+                decoded_line = line.decode("utf-8", errors="replace").rstrip("\r")
                 stdout_lines.append(decoded_line)
                 if progress_callback:
                     progress_callback(decoded_line)
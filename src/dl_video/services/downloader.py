@@ -4,15 +4,231 @@ from __future__ import annotations
 
 import asyncio
 import json
-import re
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterable
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable
 
 from dl_video.models import VideoMetadata
+from dl_video.services.backends import iter_lines
+
+# Optional faster JSON decoding; metadata dumps are often several hundred KB.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except covers both.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 if TYPE_CHECKING:
     from dl_video.services.container_service import ContainerService
 
+# Final path of the finished file, printed by yt-dlp once all post-processing
+# (merging, remuxing) is done. --print implies --quiet, so undo that to keep
+# progress and log lines flowing.
+_PATH_SENTINEL = "DLVIDEO_PATH:"
+_PRINT_PATH_ARGS = ["--print", f"after_move:{_PATH_SENTINEL}%(filepath)s", "--no-quiet"]
+
+# Fixed parts of the yt-dlp command lines, built once
+_METADATA_CMD = ("yt-dlp", "--dump-json", "--no-download", "--no-warnings", "--js-runtimes", "node")
+_FAST_METADATA_CMD = (
+    "yt-dlp", "--flat-playlist", "--dump-json", "--no-warnings",
+    "--extractor-args", "youtube:player_client=android;player_skip=configs,webpage",
+)
+_DOWNLOAD_ARGS = (
+    "--newline", "--no-warnings", "--js-runtimes", "node",
+    "-f", "bestvideo*+bestaudio/best",
+    *_PRINT_PATH_ARGS,
+)
+# Container runs leave the JS runtime to the image's yt-dlp defaults
+_CONTAINER_DOWNLOAD_ARGS = (
+    "--newline", "--no-warnings",
+    "-f", "bestvideo*+bestaudio/best",
+    *_PRINT_PATH_ARGS,
+)
+
+# Fragmented (DASH/HLS) downloads are bound by per-request latency; aria2c
+# fetches segments over parallel connections
+_ARIA2C_ARGS = (
+    "--downloader", "aria2c",
+    "--downloader-args", "aria2c:-x 16 -s 16 -k 1M --file-allocation=none",
+)
+
+# Scraped from the log as a fallback whenever the printed path never
+# arrives, e.g. after a cancel or when an external downloader is used
+_DEST_PREFIX = "[download] Destination: "
+_MERGE_PREFIX = '[Merger] Merging formats into "'
+
+# Byte forms for scanning local yt-dlp output before (or without) decoding it
+_PATH_SENTINEL_B = _PATH_SENTINEL.encode()
+_DEST_PREFIX_B = _DEST_PREFIX.encode()
+_MERGE_PREFIX_B = _MERGE_PREFIX.encode()
+_PARSED_PREFIXES = (b"[download] ", b"[Merger] ", b"ERROR:", _PATH_SENTINEL_B)
+
+# Downloads run below the UI's priority so a busy ffmpeg merge doesn't make the
+# interface stutter. POSIX lowers the child after spawning (see
+# _lower_priority) instead of using preexec_fn, which isn't thread safe.
+_DOWNLOAD_NICENESS = 5
+_SPAWN_KWARGS: dict = (
+    {"creationflags": subprocess.BELOW_NORMAL_PRIORITY_CLASS} if sys.platform == "win32" else {}
+)
+
+# Containers yt-dlp commonly produces, most likely first
+_OUTPUT_EXTENSIONS = (".mp4", ".mkv", ".webm", ".m4a", ".opus", ".mp3")
+# Unfinished downloads and yt-dlp's resume state, never the output
+_PARTIAL_SUFFIXES = (".part", ".ytdl")
+
+
+def _cookie_args(browser: str | None) -> tuple[str, ...]:
+    return ("--cookies-from-browser", browser) if browser else ()
+
+
+def _lower_priority(pid: int) -> None:
+    """Renice a child process relative to ours. No-op on Windows."""
+    if not hasattr(os, "setpriority"):
+        return
+    try:
+        niceness = os.getpriority(os.PRIO_PROCESS, 0) + _DOWNLOAD_NICENESS
+        os.setpriority(os.PRIO_PROCESS, pid, niceness)
+    except OSError:
+        pass
+
+
+def _drop_page_cache(path: Path) -> None:
+    """Ask the kernel to evict a finished file from the page cache.
+
+    The file is usually played by another program later, so keeping hundreds
+    of MB of it cached just adds memory pressure. No-op where unsupported.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _decode(data: bytes) -> str:
+    return data.decode("utf-8", errors="replace")
+
+
+def _is_format_error(error_msg: str) -> bool:
+    """Whether yt-dlp failed because the requested format isn't offered."""
+    error_lower = error_msg.lower()
+    return (
+        "format not available" in error_lower
+        or "--list-formats" in error_msg
+        or "requested format" in error_lower
+    )
+
+
+def _parse_progress(line: str | bytes) -> float | None:
+    """Parse the percentage from a '[download]  42.0% of ...' line."""
+    pct, sep, _ = line[11:].lstrip().partition("%" if isinstance(line, str) else b"%")
+    if not sep:
+        return None
+    try:
+        return float(pct)
+    except ValueError:
+        return None
+
+
+def _throttle_progress(
+    callback: Callable[[float], None], interval: float = 0.1
+) -> Callable[[float], None]:
+    """Wrap a progress callback so it fires at most once per interval.
+
+    Updates that cross a whole percent, and the final 100%, always go through.
+    """
+    last_time = 0.0
+    last_pct = -1
+
+    def throttled(pct: float) -> None:
+        nonlocal last_time, last_pct
+        now = time.monotonic()
+        if pct < 100.0 and int(pct) == last_pct and now - last_time < interval:
+            return
+        last_time = now
+        last_pct = int(pct)
+        callback(pct)
+
+    return throttled
+
+
+async def _read_first_line(stream: asyncio.StreamReader, chunk_size: int = 65536) -> bytes:
+    """Drain a stream, keeping only its first line.
+
+    A playlist dump is one JSON object per entry and only the first is used.
+    """
+    head = bytearray()
+    while chunk := await stream.read(chunk_size):
+        end = chunk.find(b"\n")
+        if end < 0:
+            head += chunk
+            continue
+        head += chunk[:end]
+        while await stream.read(chunk_size):
+            pass
+        break
+    return bytes(head)
+
+
+async def _read_tail(stream: asyncio.StreamReader, cap: int, chunk_size: int = 65536) -> bytes:
+    """Drain a stream, keeping only its last `cap` bytes."""
+    tail = bytearray()
+    while chunk := await stream.read(chunk_size):
+        tail += chunk
+        if len(tail) > cap:
+            del tail[:-cap]
+    return bytes(tail)
+
+
+# VideoMetadata fields copied as-is from the yt-dlp info dict: (field, key)
+_METADATA_FIELDS = (
+    ("uploader_id", "uploader_id"),
+    ("channel", "channel"),
+    ("channel_id", "channel_id"),
+    ("view_count", "view_count"),
+    ("like_count", "like_count"),
+    ("comment_count", "comment_count"),
+    ("upload_date", "upload_date"),
+    ("description", "description"),
+    ("tags", "tags"),
+    ("categories", "categories"),
+    ("fps", "fps"),
+    ("vcodec", "vcodec"),
+    ("acodec", "acodec"),
+    ("thumbnail_url", "thumbnail"),
+    ("extractor", "extractor"),
+)
+
+
+def _metadata_from_info(data: dict, url: str) -> VideoMetadata:
+    """Build VideoMetadata from a yt-dlp info dict."""
+    width = data.get("width")
+    height = data.get("height")
+    resolution = f"{width}x{height}" if width and height else None
+
+    return VideoMetadata(
+        title=data.get("title", "Unknown"),
+        url=url,
+        duration=data.get("duration") or 0,
+        uploader=data.get("uploader") or "Unknown",
+        resolution=resolution,
+        **{field: data.get(key) for field, key in _METADATA_FIELDS},
+    )
+
 
 class DownloadError(Exception):
     """Raised when download fails."""
@@ -21,83 +237,286 @@ class DownloadError(Exception):
 class VideoDownloader:
     """Downloads videos using yt-dlp."""
 
+    METADATA_CACHE_TTL = 600.0  # seconds before a cached metadata entry goes stale
+    METADATA_CACHE_SIZE = 256
+    # Each lookup is a yt-dlp process doing some extractor work of its own
+    METADATA_CONCURRENCY = min(4, os.cpu_count() or 1)
+
+    # Shared by all instances: the app creates a fresh downloader per job, so a
+    # per-instance cache would never see a repeat URL.
+    # Keyed on (url, cookies browser, fast)
+    _metadata_cache: OrderedDict[tuple[str, str | None, bool], tuple[float, VideoMetadata]] = OrderedDict()
+    _metadata_inflight: dict[tuple[str, str | None, bool], asyncio.Future[VideoMetadata]] = {}
+    # Callers currently awaiting each in-flight lookup
+    _metadata_waiters: dict[tuple[str, str | None, bool], int] = {}
+
     def __init__(
         self,
         cookies_browser: str | None = None,
         container_service: ContainerService | None = None,
+        use_aria2c: bool = True,
+        drop_cache_after_download: bool = False,
     ) -> None:
         self._process: asyncio.subprocess.Process | None = None
         self._cancelled = False
         self._cookies_browser = cookies_browser
+        self._cookie_args = _cookie_args(cookies_browser)
+        # Only for local downloads; the container image decides its own tools
+        self._downloader_args = _ARIA2C_ARGS if use_aria2c and shutil.which("aria2c") else ()
+        self._drop_cache_after_download = drop_cache_after_download
         self._container_service = container_service
+        self._prefetch_tasks: set[asyncio.Task[None]] = set()
+        self._cancel_task: asyncio.Task[None] | None = None
 
     def set_cookies_browser(self, browser: str | None) -> None:
         self._cookies_browser = browser
+        self._cookie_args = _cookie_args(browser)
 
     def set_container_service(self, container_service: ContainerService | None) -> None:
         self._container_service = container_service
 
-    async def get_metadata(self, url: str) -> VideoMetadata:
-        """Fetch video metadata without downloading."""
-        base_cmd = [
-            "yt-dlp",
-            "--dump-json",
-            "--no-download",
-            "--no-warnings",
-            "--js-runtimes", "node",
-        ]
+    async def get_metadata(self, url: str, fast: bool = False) -> VideoMetadata:
+        """Fetch video metadata without downloading.
+
+        Results are cached per (url, cookies browser) for METADATA_CACHE_TTL
+        seconds, and concurrent calls for the same key share one yt-dlp run.
+        The run is stopped once every caller waiting on it has been cancelled.
+
+        Args:
+            url: Video URL.
+            fast: Skip the extra extractor work needed for the full metadata
+                dump. Title, duration, uploader, channel, counts, dates,
+                description, tags and thumbnail are still populated;
+                resolution, fps and codecs are usually None because the
+                format list is not resolved. A cached full result is
+                returned when available.
+        """
+        keys = [(url, self._cookies_browser, False)]
+        if fast:
+            keys.append((url, self._cookies_browser, True))
+        for key in keys:
+            cached = self._metadata_cache.get(key)
+            if cached is None:
+                continue
+            stored_at, metadata = cached
+            if time.monotonic() - stored_at < self.METADATA_CACHE_TTL:
+                self._metadata_cache.move_to_end(key)
+                return metadata
+            del self._metadata_cache[key]
+
+        key = keys[-1]
+        task = self._metadata_inflight.get(key)
+        if task is None or task.done():
+            task = asyncio.ensure_future(self._fetch_metadata(url, fast))
+            self._metadata_inflight[key] = task
+            task.add_done_callback(lambda t: self._store_metadata(key, t))
+        waiters = self._metadata_waiters
+        waiters[key] = waiters.get(key, 0) + 1
+        try:
+            # Shield so one cancelled caller doesn't fail the others waiting on it
+            return await asyncio.shield(task)
+        finally:
+            waiters[key] -= 1
+            if not waiters[key]:
+                del waiters[key]
+                # Nobody is left to use the result; don't leave yt-dlp running
+                if not task.done():
+                    task.cancel()
+
+    async def get_metadata_many(
+        self, urls: Iterable[str], concurrency: int | None = None, fast: bool = False
+    ) -> list[VideoMetadata | BaseException]:
+        """Fetch metadata for several URLs concurrently.
+
+        Full (non-fast) lookups first run every uncached URL through a single
+        get_metadata_batch() process. Only URLs it couldn't resolve get a
+        process of their own, which also surfaces their error.
+
+        Args:
+            urls: Video URLs.
+            concurrency: Maximum number of yt-dlp processes running at once.
+                Defaults to METADATA_CONCURRENCY.
+            fast: See get_metadata().
+
+        Returns:
+            One entry per URL, in order: the metadata, or the exception raised
+            while fetching it.
+        """
+        urls = list(urls)
+        if not fast:
+            missing = [
+                url for url in dict.fromkeys(urls)
+                if (url, self._cookies_browser, False) not in self._metadata_cache
+            ]
+            if len(missing) > 1:
+                try:
+                    async for _ in self.get_metadata_batch(missing):
+                        pass
+                except DownloadError:
+                    pass
+
+        semaphore = asyncio.Semaphore(concurrency or self.METADATA_CONCURRENCY)
+
+        async def fetch(url: str) -> VideoMetadata:
+            async with semaphore:
+                return await self.get_metadata(url, fast=fast)
+
+        return await asyncio.gather(*(fetch(url) for url in urls), return_exceptions=True)
+
+    async def get_metadata_batch(self, urls: Iterable[str]) -> AsyncIterator[VideoMetadata]:
+        """Fetch metadata for many URLs with a single yt-dlp process.
+
+        Saves the interpreter and extractor start-up cost that a process per
+        URL pays each time. Results are yielded as yt-dlp produces them and are
+        added to the metadata cache. URLs that fail are skipped rather than
+        reported; use get_metadata() for the error.
+
+        The process can't be kept alive between calls to take URLs on demand:
+        yt-dlp reads the whole batch file up to EOF before extracting anything,
+        so all URLs have to be known up front.
+
+        Args:
+            urls: Video URLs.
+
+        Yields:
+            Metadata for each URL that could be extracted, in input order.
+
+        Raises:
+            DownloadError: If yt-dlp is not installed.
+        """
+        cmd = [*_METADATA_CMD, *self._cookie_args, "--batch-file", "-"]
+
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        except FileNotFoundError:
+            raise DownloadError("yt-dlp is not installed. Install it first.")
 
+        proc.stdin.write("".join(f"{url}\n" for url in urls).encode())
+        await proc.stdin.drain()
+        proc.stdin.close()
+
+        try:
+            async for line in iter_lines(proc.stdout):
+                if not line.strip():
+                    continue
+                try:
+                    data = _json_loads(line)
+                except json.JSONDecodeError:
+                    continue
+                url = data.get("original_url") or data.get("webpage_url", "")
+                metadata = _metadata_from_info(data, url)
+                self._cache_metadata((url, self._cookies_browser, False), metadata)
+                yield metadata
+            await proc.wait()
+        finally:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+
+    async def prefetch(
+        self, urls: Iterable[str], concurrency: int = 3, fast: bool = False
+    ) -> None:
+        """Warm the metadata cache for URLs the user is likely to open next.
+
+        Failures are ignored; the real get_metadata call will report them.
+        cancel_prefetch() drops lookups that have not started yet and stops
+        running ones that nothing else is waiting on.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def warm(url: str) -> None:
+            async with semaphore:
+                await self.get_metadata(url, fast=fast)
+
+        tasks = [asyncio.ensure_future(warm(url)) for url in urls]
+        self._prefetch_tasks.update(tasks)
+        try:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            self._prefetch_tasks.difference_update(tasks)
+
+    def cancel_prefetch(self) -> None:
+        """Cancel outstanding prefetch lookups."""
+        for task in self._prefetch_tasks:
+            task.cancel()
+
+    @classmethod
+    def _store_metadata(
+        cls, key: tuple[str, str | None, bool], task: asyncio.Future[VideoMetadata]
+    ) -> None:
+        cls._metadata_inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        cls._cache_metadata(key, task.result())
+
+    @classmethod
+    def _cache_metadata(
+        cls, key: tuple[str, str | None, bool], metadata: VideoMetadata
+    ) -> None:
+        cls._metadata_cache[key] = (time.monotonic(), metadata)
+        cls._metadata_cache.move_to_end(key)
+        while len(cls._metadata_cache) > cls.METADATA_CACHE_SIZE:
+            cls._metadata_cache.popitem(last=False)
+
+    @classmethod
+    def invalidate(cls, url: str) -> None:
+        """Drop cached metadata for a URL (for every cookies browser)."""
+        for key in [k for k in cls._metadata_cache if k[0] == url]:
+            del cls._metadata_cache[key]
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached metadata."""
+        cls._metadata_cache.clear()
+
+    async def _fetch_metadata(self, url: str, fast: bool = False) -> VideoMetadata:
+        base_cmd = _FAST_METADATA_CMD if fast else _METADATA_CMD
         attempts = []
-        if self._cookies_browser:
-            attempts.append(base_cmd + ["--cookies-from-browser", self._cookies_browser, url])
-        attempts.append(base_cmd + [url])
+        if self._cookie_args:
+            attempts.append([*base_cmd, *self._cookie_args, url])
+        attempts.append([*base_cmd, url])
 
         last_error = None
         for cmd in attempts:
+            proc = None
             try:
                 proc = await asyncio.create_subprocess_exec(
                     *cmd,
                     stdout=asyncio.subprocess.PIPE,
                     stderr=asyncio.subprocess.PIPE,
                 )
-                stdout, stderr = await proc.communicate()
+                # Drain both pipes concurrently so neither can fill up and
+                # stall yt-dlp, without holding on to more than is used
+                async with asyncio.TaskGroup() as tg:
+                    stdout_task = tg.create_task(_read_first_line(proc.stdout))
+                    stderr_task = tg.create_task(_read_tail(proc.stderr, 64 * 1024))
+                await proc.wait()
+                stdout, stderr = stdout_task.result(), stderr_task.result()
 
                 if proc.returncode == 0:
-                    data = json.loads(stdout.decode())
+                    # Playlists dump one object per entry; describe the first
+                    data = _json_loads(stdout)
                     break
                 else:
-                    last_error = stderr.decode().strip() or "Unknown error"
+                    last_error = _decode(stderr).strip() or "Unknown error"
+            except FileNotFoundError:
+                raise DownloadError("yt-dlp is not installed. Install it first.")
             except json.JSONDecodeError as e:
                 last_error = f"Failed to parse metadata: {e}"
+            finally:
+                # Cancelled mid-lookup: stop yt-dlp rather than orphan it
+                if proc is not None and proc.returncode is None:
+                    proc.kill()
+                    await proc.wait()
         else:
             raise DownloadError(f"Failed to fetch metadata: {last_error}")
 
-        width = data.get("width")
-        height = data.get("height")
-        resolution = f"{width}x{height}" if width and height else None
-
-        return VideoMetadata(
-            title=data.get("title", "Unknown"),
-            url=url,
-            duration=data.get("duration", 0) or 0,
-            uploader=data.get("uploader", "Unknown") or "Unknown",
-            uploader_id=data.get("uploader_id"),
-            channel=data.get("channel"),
-            channel_id=data.get("channel_id"),
-            view_count=data.get("view_count"),
-            like_count=data.get("like_count"),
-            comment_count=data.get("comment_count"),
-            upload_date=data.get("upload_date"),
-            description=data.get("description"),
-            tags=data.get("tags"),
-            categories=data.get("categories"),
-            resolution=resolution,
-            fps=data.get("fps"),
-            vcodec=data.get("vcodec"),
-            acodec=data.get("acodec"),
-            thumbnail_url=data.get("thumbnail"),
-            extractor=data.get("extractor"),
-        )
+        return _metadata_from_info(data, url)
 
     async def download(
         self,
@@ -111,14 +530,21 @@ class VideoDownloader:
         self._cancelled = False
         output_path.parent.mkdir(parents=True, exist_ok=True)
         template = str(output_path.with_suffix("")) + ".%(ext)s"
+        if progress_callback:
+            # Each update usually repaints the UI; yt-dlp reports far more often
+            progress_callback = _throttle_progress(progress_callback)
 
         if self._container_service:
-            return await self._download_via_container(
+            path = await self._download_via_container(
                 url, output_path, template, progress_callback, verbose_callback, job_id
             )
-        return await self._download_local(
-            url, output_path, template, progress_callback, verbose_callback
-        )
+        else:
+            path = await self._download_local(
+                url, output_path, template, progress_callback, verbose_callback
+            )
+        if self._drop_cache_after_download:
+            _drop_page_cache(path)
+        return path
 
     async def _download_via_container(
         self,
@@ -131,11 +557,7 @@ class VideoDownloader:
     ) -> Path:
         assert self._container_service is not None
 
-        base_args = [
-            "--newline", "--no-warnings",
-            "-f", "bestvideo*+bestaudio/best",
-            "-o", template, url,
-        ]
+        base_args = [*_CONTAINER_DOWNLOAD_ARGS, "-o", template, url]
         plain_args = ["--newline", "-o", template, url]
 
         attempts = []
@@ -161,27 +583,33 @@ class VideoDownloader:
                         await backend.cancel()
                         raise DownloadError("Download cancelled")
 
+                    # The path marker is ours, not yt-dlp's; keep it out of the log
+                    if line.startswith(_PATH_SENTINEL):
+                        # Printed path is inside the container; the file
+                        # lands in the mounted output directory
+                        printed = Path(line[len(_PATH_SENTINEL):])
+                        actual_path = output_path.parent / printed.name
+                        continue
+
                     if verbose_callback and line:
                         verbose_callback(line)
-                    if line.startswith("ERROR:"):
-                        errors.append(line)
-
-                    if m := re.search(r"\[download\]\s+(\d+\.?\d*)", line):
-                        if progress_callback:
-                            progress_callback(min(float(m.group(1)), 100.0))
-                    if m := re.search(r"\[download\] Destination: (.+)$", line):
-                        actual_path = Path(m.group(1))
-                    if m := re.search(r'\[Merger\] Merging formats into "(.+)"', line):
-                        actual_path = Path(m.group(1))
+                    # Dispatch on plain prefix checks; no regex per line
+                    if not line.startswith("["):
+                        if line.startswith("ERROR:"):
+                            errors.append(line)
+                        continue
+                    if line.startswith(_DEST_PREFIX):
+                        actual_path = Path(line[len(_DEST_PREFIX):])
+                    elif line.startswith(_MERGE_PREFIX):
+                        actual_path = Path(line[len(_MERGE_PREFIX):].rpartition('"')[0])
+                    elif progress_callback and line.startswith("[download] "):
+                        if (pct := _parse_progress(line)) is not None:
+                            progress_callback(min(pct, 100.0))
 
                 if errors:
                     error_msg = "\n".join(errors)
                     last_error = error_msg
-                    is_format_err = (
-                        "format not available" in error_msg.lower()
-                        or "--list-formats" in error_msg
-                        or "requested format" in error_msg.lower()
-                    )
+                    is_format_err = _is_format_error(error_msg)
                     if i < len(attempts) - 1 and (is_format_err or self._cookies_browser):
                         if verbose_callback:
                             verbose_callback(f"[info] Download failed with {desc}, trying fallback...")
@@ -195,11 +623,7 @@ class VideoDownloader:
                     raise DownloadError("Download cancelled")
                 error_msg = "\n".join(errors) if errors else str(e)
                 last_error = error_msg
-                is_format_err = (
-                    "format not available" in error_msg.lower()
-                    or "--list-formats" in error_msg
-                    or "requested format" in error_msg.lower()
-                )
+                is_format_err = _is_format_error(error_msg)
                 if i < len(attempts) - 1 and (is_format_err or self._cookies_browser):
                     if verbose_callback:
                         verbose_callback(f"[info] Download failed with {desc}, trying fallback...")
@@ -231,24 +655,19 @@ class VideoDownloader:
         verbose_callback: Callable[[str], None] | None = None,
     ) -> Path:
         attempts = []
-
-        if self._cookies_browser:
-            attempts.append(([
-                "yt-dlp", "--cookies-from-browser", self._cookies_browser,
-                "--newline", "--no-warnings", "--js-runtimes", "node",
-                "-f", "bestvideo*+bestaudio/best",
-                "-o", template, url,
-            ], "with cookies"))
-
-        attempts.append(([
-            "yt-dlp", "--newline", "--no-warnings", "--js-runtimes", "node",
-            "-f", "bestvideo*+bestaudio/best",
-            "-o", template, url,
-        ], "without cookies"))
-
-        attempts.append(([
-            "yt-dlp", "--newline", "-o", template, url,
-        ], "default settings"))
+        if self._cookie_args:
+            attempts.append((
+                [
+                    "yt-dlp", *self._cookie_args, *_DOWNLOAD_ARGS, *self._downloader_args,
+                    "-o", template, url,
+                ],
+                "with cookies",
+            ))
+        attempts.append((
+            ["yt-dlp", *_DOWNLOAD_ARGS, *self._downloader_args, "-o", template, url],
+            "without cookies",
+        ))
+        attempts.append((["yt-dlp", "--newline", "-o", template, url], "default settings"))
 
         last_error = None
         for i, (cmd, desc) in enumerate(attempts):
@@ -260,34 +679,49 @@ class VideoDownloader:
                     *cmd,
                     stdout=asyncio.subprocess.PIPE,
                     stderr=asyncio.subprocess.STDOUT,
+                    **_SPAWN_KWARGS,
                 )
+                # ffmpeg is only started for the merge, so it inherits this
+                _lower_priority(self._process.pid)
 
                 actual_path: Path | None = None
                 errors: list[str] = []
 
-                while True:
+                async for line in iter_lines(self._process.stdout):
                     if self._cancelled:
-                        self._process.terminate()
-                        await self._process.wait()
-                        raise DownloadError("Download cancelled")
-
-                    line = await self._process.stdout.readline()
-                    if not line:
                         break
+                    # Without a verbose consumer only a few line kinds matter,
+                    # so don't pay for decoding the rest
+                    if verbose_callback is None and not line.startswith(_PARSED_PREFIXES):
+                        continue
 
-                    text = line.decode().strip()
-                    if verbose_callback and text:
-                        verbose_callback(text)
-                    if text.startswith("ERROR:"):
-                        errors.append(text)
+                    # The path marker is ours, not yt-dlp's; keep it out of the log
+                    if line.startswith(_PATH_SENTINEL_B):
+                        actual_path = Path(_decode(line[len(_PATH_SENTINEL_B):].rstrip()))
+                        continue
 
-                    if m := re.search(r"\[download\]\s+(\d+\.?\d*)", text):
-                        if progress_callback:
-                            progress_callback(min(float(m.group(1)), 100.0))
-                    if m := re.search(r"\[download\] Destination: (.+)$", text):
-                        actual_path = Path(m.group(1))
-                    if m := re.search(r'\[Merger\] Merging formats into "(.+)"', text):
-                        actual_path = Path(m.group(1))
+                    if verbose_callback and (text := line.strip()):
+                        verbose_callback(_decode(text))
+                    # Dispatch on the raw bytes; yt-dlp starts lines at
+                    # column 0, so only the values that are kept get
+                    # stripped and progress is parsed straight from the line
+                    if not line.startswith(b"["):
+                        if line.startswith(b"ERROR:"):
+                            errors.append(_decode(line.rstrip()))
+                        continue
+                    if line.startswith(_DEST_PREFIX_B):
+                        actual_path = Path(_decode(line[len(_DEST_PREFIX_B):].rstrip()))
+                    elif line.startswith(_MERGE_PREFIX_B):
+                        actual_path = Path(_decode(line[len(_MERGE_PREFIX_B):].rpartition(b'"')[0]))
+                    elif progress_callback and line.startswith(b"[download] "):
+                        if (pct := _parse_progress(line)) is not None:
+                            progress_callback(min(pct, 100.0))
+
+                if self._cancelled:
+                    # Joins the stop cancel() started; signalling again
+                    # would cut yt-dlp's own cleanup short
+                    await self._stopping()
+                    raise DownloadError("Download cancelled")
 
                 await self._process.wait()
 
@@ -302,11 +736,6 @@ class VideoDownloader:
 
                 error_msg = "\n".join(errors) if errors else "Unknown error"
                 last_error = error_msg
-                is_format_err = (
-                    "format not available" in error_msg.lower()
-                    or "--list-formats" in error_msg
-                    or "requested format" in error_msg.lower()
-                )
                 if i < len(attempts) - 1:
                     if verbose_callback:
                         verbose_callback(f"[info] Download failed with {desc}, trying fallback...")
@@ -321,21 +750,86 @@ class VideoDownloader:
         raise DownloadError(f"Download failed: {last_error}")
 
     def _find_output_file(self, output_path: Path) -> Path | None:
+        # Stat the usual containers directly before listing the directory,
+        # which can hold thousands of entries
+        for ext in _OUTPUT_EXTENSIONS:
+            candidate = output_path.with_suffix(ext)
+            if candidate.is_file():
+                return candidate
+
+        # One scandir pass; DirEntry.is_file() uses the type readdir already
+        # returned instead of another stat per entry. "<base>.<ext>" wins and
+        # ends the scan; other names sharing the prefix (except format
+        # fragments, "<base>.f<id>.<ext>", and partial downloads) are a last
+        # resort.
         base = output_path.stem
-        parent = output_path.parent
-
-        for f in parent.iterdir():
-            if f.is_file() and f.stem == base:
-                return f
-        for f in parent.iterdir():
-            if f.is_file() and f.name.startswith(base) and not f.name.startswith(f"{base}.f"):
-                return f
-        return None
+        fragment = f"{base}.f"
+        fallback = None
+        with os.scandir(output_path.parent) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.startswith(base) or name.endswith(_PARTIAL_SUFFIXES):
+                    continue
+                if os.path.splitext(name)[0] == base:
+                    if entry.is_file():
+                        return Path(entry.path)
+                elif fallback is None and not name.startswith(fragment) and entry.is_file():
+                    fallback = Path(entry.path)
+        return fallback
 
     def cancel(self) -> None:
         self._cancelled = True
-        if self._process:
+        if not self._process:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
             try:
                 self._process.terminate()
             except ProcessLookupError:
                 pass
+            return
+        self._stopping()
+
+    async def cancel_async(self, grace: float = 2.0) -> None:
+        """Cancel the download and wait for yt-dlp to exit.
+
+        Args:
+            grace: Seconds to wait after each signal before escalating.
+        """
+        self._cancelled = True
+        if self._process:
+            await self._stopping(grace)
+
+    def _stopping(self, grace: float = 2.0) -> asyncio.Task[None]:
+        """Stop the running process, or join the stop already under way.
+
+        Each step of _stop_process gives yt-dlp time to clean up, so a
+        second, overlapping sequence must not be started.
+        """
+        if self._cancel_task is None or self._cancel_task.done():
+            self._cancel_task = asyncio.ensure_future(self._stop_process(self._process, grace))
+        return self._cancel_task
+
+    @staticmethod
+    async def _stop_process(process: asyncio.subprocess.Process, grace: float = 2.0) -> None:
+        """Stop a yt-dlp process: SIGINT, then SIGTERM, then SIGKILL.
+
+        yt-dlp treats SIGINT like Ctrl+C and shuts down cleanly, leaving a
+        resumable .part file rather than a half-written one.
+        """
+        steps = [process.terminate, process.kill]
+        if sys.platform != "win32":
+            steps.insert(0, lambda: process.send_signal(signal.SIGINT))
+        for step in steps:
+            if process.returncode is not None:
+                return
+            try:
+                step()
+            except ProcessLookupError:
+                return
+            try:
+                await asyncio.wait_for(process.wait(), grace)
+                return
+            except TimeoutError:
+                continue
@@ -6,9 +6,33 @@ error message formatting for Podman container operations.
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from enum import Enum
 
+# Path patterns are matched against the lowercased output; the path itself is
+# then sliced from the original so it keeps its case.
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+# Common patterns for permission errors
+_PERMISSION_PATH_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"permission denied[:\s]+['\"]?([^'\":\n]+)['\"]?",
+        r"cannot access[:\s]+['\"]?([^'\":\n]+)['\"]?",
+        r"open[:\s]+['\"]?([^'\":\n]+)['\"]?[:\s]+permission denied",
+    )
+)
+
+_NOT_FOUND_PATH_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"no such file or directory[:\s]+['\"]?([^'\":\n]+)['\"]?",
+        r"['\"]?([^'\":\n]+)['\"]?[:\s]+no such file or directory",
+        r"cannot find[:\s]+['\"]?([^'\":\n]+)['\"]?",
+    )
+)
+
 
 class ContainerErrorType(Enum):
     """Types of container-related errors."""
@@ -238,22 +262,24 @@ def detect_error_from_output(output: str, context: str = "") -> ContainerError |
     Returns:
         ContainerError if an error pattern is detected, None otherwise
     """
-    output_lower = output.lower()
+    # str.lower() can change the length of non-ASCII text, which would break
+    # slicing paths out of the original by match position
+    output_lower = output.lower() if output.isascii() else output.translate(_ASCII_LOWER)
 
     # Check for permission denied errors
     if "permission denied" in output_lower:
         # Try to extract the path from the error
-        path = _extract_path_from_permission_error(output)
+        path = _extract_path_from_permission_error(output, output_lower)
         return detect_volume_mount_permission_error(path or context, output)
 
     # Check for SELinux errors
     if "selinux" in output_lower or "avc:" in output_lower:
-        path = _extract_path_from_permission_error(output)
+        path = _extract_path_from_permission_error(output, output_lower)
         return detect_volume_mount_permission_error(path or context, output)
 
     # Check for file/directory not found
     if "no such file or directory" in output_lower:
-        path = _extract_path_from_not_found_error(output)
+        path = _extract_path_from_not_found_error(output, output_lower)
         if path:
             return detect_volume_mount_not_found(path)
 
@@ -276,53 +302,38 @@ def detect_error_from_output(output: str, context: str = "") -> ContainerError |
     return None
 
 
-def _extract_path_from_permission_error(output: str) -> str | None:
+def _extract_path_from_permission_error(output: str, output_lower: str) -> str | None:
     """Extract file path from permission denied error message.
 
     Args:
         output: Error output containing permission denied message
+        output_lower: The same output lowercased, with unchanged length
 
     Returns:
         Extracted path or None if not found
     """
-    import re
-
-    # Common patterns for permission errors
-    patterns = [
-        r"permission denied[:\s]+['\"]?([^'\":\n]+)['\"]?",
-        r"cannot access[:\s]+['\"]?([^'\":\n]+)['\"]?",
-        r"open[:\s]+['\"]?([^'\":\n]+)['\"]?[:\s]+permission denied",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, output, re.IGNORECASE)
+    for pattern in _PERMISSION_PATH_PATTERNS:
+        match = pattern.search(output_lower)
         if match:
-            return match.group(1).strip()
+            return output[match.start(1):match.end(1)].strip()
 
     return None
 
 
-def _extract_path_from_not_found_error(output: str) -> str | None:
+def _extract_path_from_not_found_error(output: str, output_lower: str) -> str | None:
     """Extract file path from not found error message.
 
     Args:
         output: Error output containing not found message
+        output_lower: The same output lowercased, with unchanged length
 
     Returns:
         Extracted path or None if not found
     """
-    import re
-
-    patterns = [
-        r"no such file or directory[:\s]+['\"]?([^'\":\n]+)['\"]?",
-        r"['\"]?([^'\":\n]+)['\"]?[:\s]+no such file or directory",
-        r"cannot find[:\s]+['\"]?([^'\":\n]+)['\"]?",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, output, re.IGNORECASE)
+    for pattern in _NOT_FOUND_PATH_PATTERNS:
+        match = pattern.search(output_lower)
         if match:
-            return match.group(1).strip()
+            return output[match.start(1):match.end(1)].strip()
 
     return None
 
@@ -1,11 +1,21 @@
 """File uploader service for jonesfilesandfootmassage.com."""
 
 import asyncio
+import mimetypes
+import os
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Callable
 
 import httpx
 
+# Optional HTTP/2 support (httpx needs the h2 package for it)
+try:
+    import h2  # noqa: F401
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
 
 class UploadError(Exception):
     """Exception raised when upload fails."""
@@ -13,16 +23,72 @@ class UploadError(Exception):
     pass
 
 
+# The escaping httpx (following HTML5) applies to form-data filenames:
+# quotes, backslashes and control characters other than ESC
+_FILENAME_ESCAPES = str.maketrans(
+    {'"': "%22", "\\": "\\\\", **{chr(c): f"%{c:02X}" for c in range(0x20) if c != 0x1B}}
+)
+
+
+def _multipart_envelope(boundary: str, filename: str) -> tuple[bytes, bytes]:
+    """Build the bytes around a single multipart/form-data file field.
+
+    Produces exactly what httpx sends for files={"file": (filename, ...)}.
+    """
+    content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    head = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="file"; '
+        f'filename="{filename.translate(_FILENAME_ESCAPES)}"\r\n'
+        f"Content-Type: {content_type}\r\n\r\n"
+    ).encode()
+    tail = f"\r\n--{boundary}--\r\n".encode()
+    return head, tail
+
+
 class FileUploader:
     """Service for uploading files to jonesfilesandfootmassage.com."""
 
     UPLOAD_URL = "https://jonesfilesandfootmassage.com/"
     TIMEOUT = 600.0  # 10 minutes timeout for large files
+    LIMITS = httpx.Limits(max_keepalive_connections=4, max_connections=10)
+    CHUNK_SIZE = 1024 * 1024  # Bytes per off-loop file read
+    MAX_RETRIES = 2  # Re-sends after a dropped or refused connection
+    RETRY_BACKOFF = 1.0  # Seconds before the first retry, doubled after each
+
+    # Shared by all instances: the app creates a fresh uploader per job, so a
+    # per-instance client would never get to reuse a connection.
+    _client: httpx.AsyncClient | None = None
 
     def __init__(self) -> None:
         """Initialize the uploader."""
         self._cancelled = False
-        self._client: httpx.AsyncClient | None = None
+
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        if cls._client is None or cls._client.is_closed:
+            cls._client = httpx.AsyncClient(
+                timeout=cls.TIMEOUT, limits=cls.LIMITS, http2=HAS_HTTP2
+            )
+        return cls._client
+
+    async def __aenter__(self) -> "FileUploader":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        # Nothing to release: the client is shared with uploads still in
+        # flight, so only aclose() at app shutdown closes it
+        pass
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the shared HTTP client and its pooled connections.
+
+        Call once at shutdown; any upload still running loses its connection.
+        """
+        client, cls._client = cls._client, None
+        if client is not None:
+            await client.aclose()
 
     async def upload(
         self,
@@ -45,10 +111,10 @@ class FileUploader:
         """
         self._cancelled = False
 
-        if not file_path.exists():
+        try:
+            file_size = (await asyncio.to_thread(file_path.stat)).st_size
+        except FileNotFoundError:
             raise UploadError(f"File not found: {file_path}")
-
-        file_size = file_path.stat().st_size
         if file_size == 0:
             raise UploadError("Cannot upload empty file")
 
@@ -64,52 +130,59 @@ class FileUploader:
             log(f"Starting upload to {self.UPLOAD_URL}")
             log(f"File: {file_path.name} ({file_size / (1024*1024):.2f} MB)")
 
-            async with httpx.AsyncClient(timeout=self.TIMEOUT) as client:
-                self._client = client
-
-                if self._cancelled:
-                    raise UploadError("Upload cancelled")
-
-                # Read file and upload
-                log("Reading file...")
-                with open(file_path, "rb") as f:
-                    file_content = f.read()
-
-                if progress_callback:
-                    progress_callback(50.0)  # Reading complete
-                log("File read complete")
+            client = self._get_client()
+
+            if self._cancelled:
+                raise UploadError("Upload cancelled")
+
+            # Upload to jonesfilesandfootmassage.com using multipart form.
+            # The body is streamed from disk a chunk at a time, so a
+            # multi-GB video is never held in memory.
+            log("Uploading to server...")
+            boundary = os.urandom(16).hex()
+            head, tail = _multipart_envelope(boundary, file_path.name)
+            headers = {
+                "Content-Type": f"multipart/form-data; boundary={boundary}",
+                "Content-Length": str(len(head) + file_size + len(tail)),
+            }
+            for attempt in range(self.MAX_RETRIES + 1):
+                body = self._stream_body(file_path, file_size, head, tail, progress_callback)
+                try:
+                    response = await client.post(self.UPLOAD_URL, content=body, headers=headers)
+                    break
+                except httpx.TransportError as e:
+                    # Timeouts are reported as-is; a flaky link is worth
+                    # another attempt since the body can simply be re-read
+                    if (
+                        isinstance(e, httpx.TimeoutException)
+                        or attempt == self.MAX_RETRIES
+                        or self._cancelled
+                    ):
+                        raise
+                    delay = self.RETRY_BACKOFF * 2**attempt
+                    log(f"Network error ({e}), retrying in {delay:.0f}s...")
+                    await asyncio.sleep(delay)
+
+            log(f"Server response: {response.status_code}")
+
+            if response.status_code != 200:
+                log(f"ERROR: Upload failed - {response.text[:200]}")
+                raise UploadError(
+                    f"Upload failed with status {response.status_code}"
+                )
+
+            # Parse response to get URL
+            url = response.text.strip()
+
+            if not url.startswith("http"):
+                log(f"ERROR: Unexpected response - {url[:100]}")
+                raise UploadError(f"Unexpected response: {url[:100]}")
 
-                if self._cancelled:
-                    raise UploadError("Upload cancelled")
-
-                # Upload to jonesfilesandfootmassage.com using multipart form
-                log("Uploading to server...")
-                files = {"file": (file_path.name, file_content)}
-                response = await client.post(self.UPLOAD_URL, files=files)
-
-                if progress_callback:
-                    progress_callback(90.0)  # Upload complete
-
-                log(f"Server response: {response.status_code}")
-
-                if response.status_code != 200:
-                    log(f"ERROR: Upload failed - {response.text[:200]}")
-                    raise UploadError(
-                        f"Upload failed with status {response.status_code}"
-                    )
-
-                # Parse response to get URL
-                url = response.text.strip()
-
-                if not url.startswith("http"):
-                    log(f"ERROR: Unexpected response - {url[:100]}")
-                    raise UploadError(f"Unexpected response: {url[:100]}")
-
-                if progress_callback:
-                    progress_callback(100.0)
+            if progress_callback:
+                progress_callback(100.0)
 
-                log(f"Upload complete: {url}")
-                return url
+            log(f"Upload complete: {url}")
+            return url
 
         except httpx.TimeoutException:
             log("ERROR: Upload timed out")
@@ -122,8 +195,38 @@ class FileUploader:
         except Exception as e:
             log(f"ERROR: {e}")
             raise UploadError(f"Upload error: {e}")
+
+    async def _stream_body(
+        self,
+        file_path: Path,
+        file_size: int,
+        head: bytes,
+        tail: bytes,
+        progress_callback: Callable[[float], None] | None,
+    ) -> AsyncIterator[bytes]:
+        """Yield the multipart body, reading the file off the event loop.
+
+        Progress follows the bytes handed to httpx, stopping short of 100
+        until the server has answered. Cancellation is checked per chunk.
+        """
+        yield head
+        f = await asyncio.to_thread(open, file_path, "rb")
+        try:
+            sent = 0
+            last_pct = -1
+            while chunk := await asyncio.to_thread(f.read, self.CHUNK_SIZE):
+                if self._cancelled:
+                    raise UploadError("Upload cancelled")
+                sent += len(chunk)
+                if progress_callback:
+                    pct = min(99, sent * 100 // file_size)
+                    if pct != last_pct:
+                        last_pct = pct
+                        progress_callback(float(pct))
+                yield chunk
         finally:
-            self._client = None
+            f.close()
+        yield tail
 
     def cancel(self) -> None:
         """Cancel the current upload operation."""
@@ -1,6 +1,8 @@
 """State machine for operation state transitions."""
 
-from dl_video.models import OperationState
+from collections.abc import Sequence
+
+from dl_video.models import ACTIVE_STATES, TERMINAL_STATES, OperationState
 
 
 class InvalidStateTransition(Exception):
@@ -57,6 +59,14 @@ VALID_TRANSITIONS: dict[OperationState, set[OperationState]] = {
     OperationState.ERROR: {OperationState.IDLE},
 }
 
+# VALID_TRANSITIONS packed into one bitmask per state, so a check is an AND
+# instead of a dict lookup plus a set membership test
+_STATE_BITS = {state: 1 << i for i, state in enumerate(OperationState)}
+_TRANSITION_MASKS = {
+    state: sum(_STATE_BITS[to] for to in VALID_TRANSITIONS.get(state, ()))
+    for state in OperationState
+}
+
 
 class OperationStateMachine:
     """State machine for managing operation state transitions."""
@@ -72,9 +82,17 @@ class OperationStateMachine:
         return self._state
 
     @property
-    def history(self) -> list[OperationState]:
-        """Get the state transition history."""
-        return self._history.copy()
+    def history(self) -> Sequence[OperationState]:
+        """Get the state transition history.
+
+        This is a live read-only view, not a copy: it grows with later
+        transitions. Don't modify it; use history_snapshot() for a copy.
+        """
+        return self._history
+
+    def history_snapshot(self) -> tuple[OperationState, ...]:
+        """Get a copy of the state transition history as it is now."""
+        return tuple(self._history)
 
     def can_transition_to(self, new_state: OperationState) -> bool:
         """Check if transition to new state is valid.
@@ -85,8 +103,7 @@ class OperationStateMachine:
         Returns:
             True if transition is valid, False otherwise.
         """
-        valid_next_states = VALID_TRANSITIONS.get(self._state, set())
-        return new_state in valid_next_states
+        return bool(_TRANSITION_MASKS[self._state] & _STATE_BITS[new_state])
 
     def transition_to(self, new_state: OperationState) -> None:
         """Transition to a new state.
@@ -105,11 +122,7 @@ class OperationStateMachine:
 
     def reset(self) -> None:
         """Reset the state machine to IDLE state."""
-        if self._state in {
-            OperationState.COMPLETED,
-            OperationState.CANCELLED,
-            OperationState.ERROR,
-        }:
+        if self._state in TERMINAL_STATES:
             self._state = OperationState.IDLE
             self._history.append(OperationState.IDLE)
         elif self._state == OperationState.IDLE:
@@ -123,12 +136,7 @@ class OperationStateMachine:
         Returns:
             True if in an active state, False otherwise.
         """
-        return self._state in {
-            OperationState.FETCHING_METADATA,
-            OperationState.DOWNLOADING,
-            OperationState.CONVERTING,
-            OperationState.UPLOADING,
-        }
+        return self._state in ACTIVE_STATES
 
     def is_terminal(self) -> bool:
         """Check if in a terminal state.
@@ -136,8 +144,4 @@ class OperationStateMachine:
         Returns:
             True if in a terminal state, False otherwise.
         """
-        return self._state in {
-            OperationState.COMPLETED,
-            OperationState.CANCELLED,
-            OperationState.ERROR,
-        }
+        return self._state in TERMINAL_STATES
@@ -1,7 +1,7 @@
 """Utility modules for dl-video."""
 
 from dl_video.utils.clipboard import ClipboardError, copy_to_clipboard
-from dl_video.utils.file_ops import open_file_in_folder, open_folder
+from dl_video.utils.file_ops import open_file_in_folder, open_folder, write_atomic
 from dl_video.utils.slugifier import Slugifier
 from dl_video.utils.validator import URLValidator, ValidationResult
 
@@ -13,4 +13,5 @@ __all__ = [
     "Slugifier",
     "URLValidator",
     "ValidationResult",
+    "write_atomic",
 ]
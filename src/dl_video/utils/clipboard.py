@@ -1,9 +1,25 @@
 """Clipboard utilities for dl-video."""
 
+import shutil
 import subprocess
 import sys
+from functools import cache
 from typing import Optional
 
+# Optional cross-platform clipboard support
+try:
+    import pyperclip
+    HAS_PYPERCLIP = True
+except ImportError:
+    HAS_PYPERCLIP = False
+
+# Linux clipboard tools in order of preference: Wayland, then X11
+_LINUX_COMMANDS = (
+    ["wl-copy"],
+    ["xclip", "-selection", "clipboard"],
+    ["xsel", "--clipboard", "--input"],
+)
+
 
 class ClipboardError(Exception):
     """Exception raised when clipboard operations fail."""
@@ -26,16 +42,13 @@ def copy_to_clipboard(text: str) -> bool:
         ClipboardError: If clipboard operation fails and no fallback available.
     """
     # Try pyperclip first (cross-platform)
-    try:
-        import pyperclip
-
-        pyperclip.copy(text)
-        return True
-    except ImportError:
-        pass
-    except Exception:
-        # pyperclip failed, try platform-specific fallback
-        pass
+    if HAS_PYPERCLIP:
+        try:
+            pyperclip.copy(text)
+            return True
+        except Exception:
+            # pyperclip failed, try platform-specific fallback
+            pass
 
     # Platform-specific fallbacks
     if sys.platform == "darwin":
@@ -74,7 +87,7 @@ def _copy_macos(text: str) -> bool:
 
 
 def _copy_linux(text: str) -> bool:
-    """Copy text to clipboard on Linux using xclip, xsel, or wl-copy.
+    """Copy text to clipboard on Linux using wl-copy, xclip, or xsel.
 
     Args:
         text: The text to copy.
@@ -82,19 +95,15 @@ def _copy_linux(text: str) -> bool:
     Returns:
         True if successful, False otherwise.
     """
-    # Try wl-copy first (Wayland)
-    if _try_command(["wl-copy"], text):
-        return True
+    # Only the installed tools are tried, so a missing wl-copy/xclip
+    # doesn't cost a failed spawn on every copy
+    return any(_try_command(cmd, text) for cmd in _installed_linux_commands())
 
-    # Try xclip (X11)
-    if _try_command(["xclip", "-selection", "clipboard"], text):
-        return True
 
-    # Try xsel (X11)
-    if _try_command(["xsel", "--clipboard", "--input"], text):
-        return True
-
-    return False
+@cache
+def _installed_linux_commands() -> tuple[list[str], ...]:
+    """Find which Linux clipboard tools are on PATH (looked up once)."""
+    return tuple(cmd for cmd in _LINUX_COMMANDS if shutil.which(cmd[0]))
 
 
 def _copy_windows(text: str) -> bool:
@@ -108,11 +117,10 @@ def _copy_windows(text: str) -> bool:
     """
     try:
         process = subprocess.Popen(
-            ["clip"],
+            [_clip_exe()],
             stdin=subprocess.PIPE,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
-            shell=True,
         )
         process.communicate(input=text.encode("utf-16le"))
         return process.returncode == 0
@@ -120,6 +128,12 @@ def _copy_windows(text: str) -> bool:
         return False
 
 
+@cache
+def _clip_exe() -> str:
+    """Resolve clip.exe once, so it is launched without a cmd.exe shell."""
+    return shutil.which("clip") or "clip"
+
+
 def _try_command(cmd: list[str], text: str) -> bool:
     """Try to run a clipboard command.
 
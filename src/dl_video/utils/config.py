@@ -1,9 +1,24 @@
 """Configuration management for dl-video application."""
 
 import json
+from dataclasses import replace
 from pathlib import Path
 
 from dl_video.models import Config
+from dl_video.utils.file_ops import write_atomic
+
+# Optional faster JSON encoding/decoding
+try:
+    import orjson
+    from orjson import loads as _json_loads
+
+    def _json_dumps(data: dict) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    from json import loads as _json_loads
+
+    def _json_dumps(data: dict) -> bytes:
+        return json.dumps(data, indent=2).encode()
 
 
 class ConfigManager:
@@ -14,15 +29,32 @@ class ConfigManager:
     def __init__(self, config_path: Path | None = None):
         """Initialize ConfigManager with optional custom path."""
         self.config_path = config_path or self.CONFIG_PATH
+        self._saved: bytes | None = None
+        # Last loaded config and the (mtime, size) of the file it came from
+        self._cached: Config | None = None
+        self._cached_stamp: tuple[int, int] | None = None
 
     def load(self) -> Config:
-        """Load configuration from file, returning defaults if not found."""
-        if not self.config_path.exists():
+        """Load configuration from file, returning defaults if not found.
+
+        The parsed config is reused until the file changes on disk; each
+        call still returns a fresh copy the caller is free to modify.
+        """
+        try:
+            st = self.config_path.stat()
+        except FileNotFoundError:
             return Config.default()
 
+        stamp = (st.st_mtime_ns, st.st_size)
+        if self._cached is None or stamp != self._cached_stamp:
+            self._cached = self._read()
+            self._cached_stamp = stamp
+        return replace(self._cached)
+
+    def _read(self) -> Config:
+        """Parse the config file, falling back to defaults if it is invalid."""
         try:
-            with open(self.config_path, "r") as f:
-                data = json.load(f)
+            data = _json_loads(self.config_path.read_bytes())
             return Config(
                 download_dir=Path(data.get("download_dir", str(Config.default().download_dir))),
                 auto_upload=data.get("auto_upload", False),
@@ -37,8 +69,6 @@ class ConfigManager:
 
     def save(self, config: Config) -> None:
         """Save configuration to file."""
-        self.config_path.parent.mkdir(parents=True, exist_ok=True)
-
         data = {
             "download_dir": str(config.download_dir),
             "auto_upload": config.auto_upload,
@@ -48,5 +78,11 @@ class ConfigManager:
             "container_image": config.container_image,
         }
 
-        with open(self.config_path, "w") as f:
-            json.dump(data, f, indent=2)
+        # The app saves on every settings change; skip rewriting identical data
+        serialized = _json_dumps(data)
+        if serialized == self._saved and self.config_path.exists():
+            return
+        self.config_path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.config_path, serialized)
+        self._saved = serialized
+        self._cached = None
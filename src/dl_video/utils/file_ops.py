@@ -1,8 +1,39 @@
 """File operation utilities for dl-video."""
 
+import os
+import shutil
 import subprocess
 import sys
+import tempfile
+from functools import cache
 from pathlib import Path
+from stat import S_ISREG
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Replace a file's contents so readers see either the old or new data.
+
+    The data is written to a uniquely named temporary file beside the
+    target, synced to disk, and renamed over it. A crash mid-write can't
+    leave an empty or truncated file behind, and concurrent writers don't
+    share a temporary file.
+
+    Args:
+        path: Path of the file to write.
+        data: The complete new contents.
+    """
+    tmp = tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False
+    )
+    try:
+        with tmp:
+            tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp.name, path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
 
 
 def open_folder(path: Path) -> bool:
@@ -20,16 +51,28 @@ def open_folder(path: Path) -> bool:
     Returns:
         True if the folder was opened successfully, False otherwise.
     """
-    # Ensure we have a directory path
-    if path.is_file():
-        path = path.parent
-
     # Resolve to absolute path
     path = path.resolve()
 
-    if not path.exists():
+    # One stat answers both "does it exist" and "is it a file"
+    try:
+        if S_ISREG(path.stat().st_mode):
+            path = path.parent
+    except OSError:
         return False
 
+    return _open_resolved_folder(path)
+
+
+def _open_resolved_folder(path: Path) -> bool:
+    """Open an existing, already-resolved folder with the platform handler.
+
+    Args:
+        path: Absolute path to the folder.
+
+    Returns:
+        True if the folder was opened successfully, False otherwise.
+    """
     if sys.platform == "darwin":
         return _open_folder_macos(path)
     elif sys.platform == "linux":
@@ -91,16 +134,21 @@ def _open_folder_windows(path: Path) -> bool:
     """
     try:
         subprocess.Popen(
-            ["explorer", str(path)],
+            [_explorer_exe(), str(path)],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
-            shell=True,
         )
         return True
     except (subprocess.SubprocessError, FileNotFoundError, OSError):
         return False
 
 
+@cache
+def _explorer_exe() -> str:
+    """Resolve explorer.exe once, so it is launched without a cmd.exe shell."""
+    return shutil.which("explorer") or "explorer"
+
+
 def open_file_in_folder(file_path: Path) -> bool:
     """Open a file manager with the specified file selected.
 
@@ -130,5 +178,6 @@ def open_file_in_folder(file_path: Path) -> bool:
         except (subprocess.SubprocessError, FileNotFoundError, OSError):
             return False
     else:
-        # Other platforms: just open the containing folder
-        return open_folder(file_path.parent)
+        # Other platforms: just open the containing folder, which is
+        # known to exist now
+        return _open_resolved_folder(file_path.parent)
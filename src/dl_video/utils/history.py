@@ -1,14 +1,37 @@
 """History persistence using JSON."""
 
+import asyncio
 import json
-from dataclasses import asdict, dataclass, field
+from collections import deque
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 
+from dl_video.utils.file_ops import write_atomic
+
+# Optional faster JSON encoding/decoding; history grows with every download
+try:
+    import orjson
+    from orjson import loads as _json_loads
+
+    def _json_dumps(data: dict) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    from json import loads as _json_loads
+
+    def _json_dumps(data: dict) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
 
 @dataclass
 class MetadataRecord:
-    """Metadata stored with history record."""
+    """Metadata stored with history record.
+
+    Records aren't modified after creation, so the formatted_* values are
+    computed on first access and then cached.
+    """
 
     title: str | None = None
     duration: int | None = None
@@ -29,7 +52,30 @@ class MetadataRecord:
     thumbnail_url: str | None = None
     extractor: str | None = None
 
-    @property
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-ready dict (much cheaper than asdict())."""
+        return {
+            "title": self.title,
+            "duration": self.duration,
+            "uploader": self.uploader,
+            "uploader_id": self.uploader_id,
+            "channel": self.channel,
+            "view_count": self.view_count,
+            "like_count": self.like_count,
+            "comment_count": self.comment_count,
+            "upload_date": self.upload_date,
+            "description": self.description,
+            "tags": self.tags,
+            "categories": self.categories,
+            "resolution": self.resolution,
+            "fps": self.fps,
+            "vcodec": self.vcodec,
+            "acodec": self.acodec,
+            "thumbnail_url": self.thumbnail_url,
+            "extractor": self.extractor,
+        }
+
+    @cached_property
     def formatted_duration(self) -> str | None:
         """Format duration as HH:MM:SS or MM:SS."""
         if self.duration is None:
@@ -41,14 +87,14 @@ class MetadataRecord:
         seconds = self.duration % 60
         return f"{hours}:{minutes:02d}:{seconds:02d}"
 
-    @property
+    @cached_property
     def formatted_upload_date(self) -> str | None:
         """Format upload date as YYYY-MM-DD."""
         if not self.upload_date or len(self.upload_date) != 8:
             return None
         return f"{self.upload_date[:4]}-{self.upload_date[4:6]}-{self.upload_date[6:]}"
 
-    @property
+    @cached_property
     def formatted_views(self) -> str | None:
         """Format view count with K/M suffix."""
         if self.view_count is None:
@@ -72,6 +118,20 @@ class HistoryRecord:
     timestamp: str
     metadata: MetadataRecord | None = None
 
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-ready dict, leaving out missing metadata."""
+        data = {
+            "filename": self.filename,
+            "source_url": self.source_url,
+            "file_path": self.file_path,
+            "file_size": self.file_size,
+            "upload_url": self.upload_url,
+            "timestamp": self.timestamp,
+        }
+        if self.metadata is not None:
+            data["metadata"] = self.metadata.to_dict()
+        return data
+
     @classmethod
     def create(
         cls,
@@ -95,82 +155,165 @@ class HistoryRecord:
 
 
 class HistoryManager:
-    """Manages persistent history storage."""
+    """Manages persistent history storage.
+
+    Inside a running event loop, changes are written shortly after the last
+    one in a background thread; call flush() before exiting. Without a loop
+    every change is written straight away.
 
-    def __init__(self, history_file: Path | None = None) -> None:
+    A failed background write is passed to on_save_error; the changes stay
+    pending and go out with the next write.
+    """
+
+    FLUSH_DELAY = 0.5  # Seconds of quiet before pending changes are written
+
+    def __init__(
+        self,
+        history_file: Path | None = None,
+        on_save_error: Callable[[OSError], None] | None = None,
+    ) -> None:
         """Initialize the history manager.
         
         Args:
             history_file: Path to history file. Defaults to ~/.config/dl-video/history.json
+            on_save_error: Optional callback for errors writing the file from flush().
         """
         if history_file is None:
             config_dir = Path.home() / ".config" / "dl-video"
             config_dir.mkdir(parents=True, exist_ok=True)
             history_file = config_dir / "history.json"
         self._history_file = history_file
-        self._records: list[HistoryRecord] = []
+        self._on_save_error = on_save_error
+        # Newest first; a deque makes prepending a record O(1)
+        self._records: deque[HistoryRecord] = deque()
+        # Newest record per URL, kept in step with _records
+        self._by_source: dict[str, HistoryRecord] = {}
+        self._by_upload: dict[str, HistoryRecord] = {}
+        self._saved: bytes | None = None
+        self._dirty = False
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_task: asyncio.Task | None = None
+        self._flush_lock = asyncio.Lock()
         self._load()
 
     def _load(self) -> None:
         """Load history from file."""
+        self._records = deque()
+        self._by_source = {}
+        self._by_upload = {}
         if not self._history_file.exists():
-            self._records = []
             return
         
         try:
-            with open(self._history_file, "r") as f:
-                data = json.load(f)
-            self._records = []
+            data = _json_loads(self._history_file.read_bytes())
             for record_data in data.get("history", []):
                 # Handle metadata if present
                 metadata_data = record_data.pop("metadata", None)
                 metadata = None
                 if metadata_data:
                     metadata = MetadataRecord(**metadata_data)
-                self._records.append(HistoryRecord(**record_data, metadata=metadata))
+                record = HistoryRecord(**record_data, metadata=metadata)
+                self._records.append(record)
+                # The file is newest first, so keep the first hit per URL
+                self._by_source.setdefault(record.source_url, record)
+                if record.upload_url:
+                    self._by_upload.setdefault(record.upload_url, record)
         except (json.JSONDecodeError, TypeError, KeyError):
-            self._records = []
-
-    def _save(self) -> None:
-        """Save history to file."""
-        history_list = []
-        for r in self._records:
-            record_dict = asdict(r)
-            # Remove None metadata to keep JSON clean
-            if record_dict.get("metadata") is None:
-                del record_dict["metadata"]
-            history_list.append(record_dict)
-        data = {"history": history_list}
-        with open(self._history_file, "w") as f:
-            json.dump(data, f, indent=2)
+            self._records = deque()
+            self._by_source = {}
+            self._by_upload = {}
+
+    def _save(self, records: Iterable[HistoryRecord] | None = None) -> None:
+        """Save history to file.
+
+        Args:
+            records: Snapshot of the records to write; defaults to the
+                current ones. Background flushes pass a copy so the thread
+                never iterates the deque while the UI changes it.
+        """
+        if records is None:
+            records = self._records
+        history_list = [r.to_dict() for r in records]
+        data = _json_dumps({"history": history_list})
+        if data == self._saved:
+            return
+        write_atomic(self._history_file, data)
+        self._saved = data
 
     def add(self, record: HistoryRecord) -> None:
         """Add a record to history."""
-        self._records.insert(0, record)
-        self._save()
+        self._records.appendleft(record)
+        self._by_source[record.source_url] = record
+        if record.upload_url:
+            self._by_upload[record.upload_url] = record
+        self._schedule_save()
+
+    def get_all(self) -> Sequence[HistoryRecord]:
+        """Get all history records, newest first.
+
+        This is a live read-only view, not a copy: it reflects later add()
+        and clear() calls. Don't modify it; use snapshot() for a copy that
+        stays as it is.
+        """
+        return self._records
 
-    def get_all(self) -> list[HistoryRecord]:
-        """Get all history records, newest first."""
-        return self._records.copy()
+    def snapshot(self) -> tuple[HistoryRecord, ...]:
+        """Get a copy of all history records, newest first."""
+        return tuple(self._records)
 
     def find_by_source(self, source_url: str) -> HistoryRecord | None:
-        """Find a record by source URL."""
-        for record in self._records:
-            if record.source_url == source_url:
-                return record
-        return None
+        """Find the newest record for a source URL."""
+        return self._by_source.get(source_url)
 
     def find_by_upload(self, upload_url: str) -> HistoryRecord | None:
-        """Find a record by upload URL."""
-        for record in self._records:
-            if record.upload_url == upload_url:
-                return record
-        return None
+        """Find the newest record for an upload URL."""
+        return self._by_upload.get(upload_url)
 
     def clear(self) -> None:
         """Clear all history."""
-        self._records = []
-        self._save()
+        # In place, so views from get_all() stay live
+        self._records.clear()
+        self._by_source.clear()
+        self._by_upload.clear()
+        self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        """Save now, or after FLUSH_DELAY when running in an event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._save()
+            return
+        self._dirty = True
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        self._flush_handle = loop.call_later(self.FLUSH_DELAY, self._start_flush)
+
+    def _start_flush(self) -> None:
+        self._flush_handle = None
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self.flush())
+
+    async def flush(self) -> None:
+        """Write any pending changes to disk without blocking the loop.
+
+        Write errors are reported to on_save_error rather than raised, since
+        this usually runs as a background task nobody awaits.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        async with self._flush_lock:
+            # Changes made while a write is in progress go out in the next pass
+            while self._dirty:
+                self._dirty = False
+                try:
+                    await asyncio.to_thread(self._save, list(self._records))
+                except OSError as e:
+                    self._dirty = True
+                    if self._on_save_error is not None:
+                        self._on_save_error(e)
+                    return
 
     @property
     def count(self) -> int:
@@ -1,6 +1,16 @@
 """Slugifier utility for converting strings to filesystem-safe slugs."""
 
 import re
+import string
+
+# A run of anything other than a-z/0-9, replaced by a single underscore
+_NON_ALNUM_RUN = re.compile(r"[^a-z0-9]+")
+
+# The same mapping as a per-character table for the (common) ASCII case
+_KEEP = set(string.ascii_lowercase + string.digits)
+_ASCII_SLUG_TABLE = str.maketrans(
+    {chr(i): chr(i) if chr(i) in _KEEP else "_" for i in range(128)}
+)
 
 
 class Slugifier:
@@ -23,11 +33,17 @@ class Slugifier:
         # Convert to lowercase
         result = text.lower()
 
-        # Replace non-alphanumeric characters with underscores
-        result = re.sub(r"[^a-z0-9]", "_", result)
-
-        # Collapse multiple consecutive underscores into one
-        result = re.sub(r"_+", "_", result)
+        if result.isascii():
+            # Replace non-alphanumeric characters with underscores in one C
+            # loop, then collapse the runs (each pass halves them)
+            result = result.translate(_ASCII_SLUG_TABLE)
+            while "__" in result:
+                result = result.replace("__", "_")
+        else:
+            # Replace each run of non-alphanumeric characters with one
+            # underscore (underscores are in the run, so this also
+            # collapses consecutive underscores)
+            result = _NON_ALNUM_RUN.sub("_", result)
 
         # Strip leading and trailing underscores
         result = result.strip("_")
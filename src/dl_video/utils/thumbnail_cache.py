@@ -1,10 +1,61 @@
 """Thumbnail caching for video metadata."""
 
+from __future__ import annotations
+
+import base64
 import hashlib
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from importlib.util import find_spec
 from io import BytesIO
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+# PIL.Image (and its plugins) is imported only where an image is actually
+# decoded, which happens in worker threads; checking for or locating cached
+# thumbnails never pays for it
+if TYPE_CHECKING:
+    from PIL import Image
+
+# Thumbnails are only for display, so store them lossy: WebP encodes faster
+# and is several times smaller than PNG. Pillow can be built without WebP,
+# in which case fall back to quick-to-encode PNG.
+if find_spec("PIL._webp") is not None:
+    _CACHE_SUFFIX = ".webp"
+    _CACHE_FORMAT = "WEBP"
+    _SAVE_OPTIONS = {"quality": 85, "method": 4}
+else:
+    _CACHE_SUFFIX = ".png"
+    _CACHE_FORMAT = "PNG"
+    _SAVE_OPTIONS = {"compress_level": 1}
+
+# Suffixes of files this cache has ever written (older versions used PNG)
+_CACHE_SUFFIXES = (".webp", ".png")
+# Length of a current filename: 22 characters of digest plus the suffix
+_CACHE_NAME_LENGTH = 22 + len(_CACHE_SUFFIX)
+
+
+def _url_digest(url: str) -> bytes:
+    """Hash a URL for use as its cache key.
+
+    The hash only needs to spread URLs over filenames, not resist attacks;
+    BLAKE2b is in the stdlib and a little cheaper than MD5.
+    """
+    return hashlib.blake2b(url.encode(), digest_size=16, usedforsecurity=False).digest()
+
+
+@lru_cache(maxsize=1024)
+def _url_to_filename(url: str) -> str:
+    """Convert URL to a cache filename.
 
-from PIL import Image
+    The digest is URL-safe base64 (22 characters) rather than hex (32).
+    Memoized at module level because the app creates a new ThumbnailCache
+    per screen, yet keeps asking about the same few URLs.
+    """
+    url_hash = base64.urlsafe_b64encode(_url_digest(url)).rstrip(b"=").decode("ascii")
+    return f"{url_hash}{_CACHE_SUFFIX}"
 
 
 def get_best_thumbnail_url(url: str) -> str:
@@ -27,6 +78,16 @@ def get_best_thumbnail_url(url: str) -> str:
 class ThumbnailCache:
     """Caches downloaded thumbnails locally."""
 
+    MEMORY_CACHE_SIZE = 32  # Decoded images kept in RAM (~1 MB each at 800px)
+
+    # Shared by all instances (the app makes a new cache per screen), keyed
+    # by file path. get() runs in worker threads, hence the lock.
+    _images: OrderedDict[Path, Image.Image] = OrderedDict()
+    _images_lock = threading.Lock()
+    # Per cache directory: files still named the way older versions named
+    # them, found by a single scan on first use
+    _legacy_names: dict[Path, set[str]] = {}
+
     def __init__(self, cache_dir: Path | None = None) -> None:
         """Initialize the thumbnail cache.
         
@@ -37,34 +98,99 @@ class ThumbnailCache:
         if cache_dir is None:
             cache_dir = Path.home() / ".config" / "dl-video" / "thumbnails"
         self._cache_dir = cache_dir
-        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        # Created on first save; reads just miss while it doesn't exist
+        self._dir_ready = False
+        # (size, count) and the directory mtime they were computed at
+        self._stats: tuple[int, int] | None = None
+        self._stats_mtime: int | None = None
+
+    def _legacy_files(self) -> set[str]:
+        """Names of files in the cache directory that predate the current naming."""
+        names = self._legacy_names.get(self._cache_dir)
+        if names is None:
+            names = self._legacy_names[self._cache_dir] = {
+                entry.name
+                for entry in self._cached_entries()
+                if not (
+                    entry.name.endswith(_CACHE_SUFFIX)
+                    and len(entry.name) == _CACHE_NAME_LENGTH
+                )
+            }
+        return names
+
+    def _migrate_legacy(self, url: str, cache_path: Path) -> bool:
+        """Move a thumbnail cached under an older name to its new path.
 
-    def _url_to_filename(self, url: str) -> str:
-        """Convert URL to a cache filename."""
-        url_hash = hashlib.md5(url.encode()).hexdigest()
-        return f"{url_hash}.png"
+        Older versions named files by MD5 or a hex digest, and/or stored
+        them as PNG. The file is only renamed; Pillow detects the format
+        from its contents. Only names seen by the first scan of the
+        directory are tried, so once every legacy file has been moved a
+        miss costs nothing extra.
+
+        Returns:
+            True if a legacy file was found and moved.
+        """
+        legacy_files = self._legacy_files()
+        if not legacy_files:
+            return False
+        md5_hex = hashlib.md5(url.encode(), usedforsecurity=False).hexdigest()
+        hex_digest = _url_digest(url).hex()
+        legacy_names = (
+            f"{md5_hex}.png",
+            f"{hex_digest}.webp",
+            f"{hex_digest}.png",
+            cache_path.with_suffix(".png").name,
+        )
+        for legacy_name in legacy_names:
+            if legacy_name not in legacy_files:
+                continue
+            legacy_files.discard(legacy_name)
+            try:
+                (self._cache_dir / legacy_name).rename(cache_path)
+            except FileNotFoundError:
+                continue
+            return True
+        return False
 
     def get_path(self, url: str) -> Path:
         """Get the cache path for a URL."""
-        return self._cache_dir / self._url_to_filename(url)
+        return self._cache_dir / _url_to_filename(url)
 
     def has(self, url: str) -> bool:
         """Check if a thumbnail is cached."""
-        return self.get_path(url).exists()
+        cache_path = self.get_path(url)
+        return cache_path.exists() or self._migrate_legacy(url, cache_path)
 
     def get(self, url: str) -> Image.Image | None:
         """Get a cached thumbnail image.
         
         Returns:
-            PIL Image if cached, None otherwise.
+            PIL Image if cached, None otherwise. Each call returns a new
+            copy, which the caller is free to modify.
         """
         cache_path = self.get_path(url)
-        if not cache_path.exists():
-            return None
+        with self._images_lock:
+            image = self._images.get(cache_path)
+            if image is not None:
+                self._images.move_to_end(cache_path)
+                return image.copy()
+
+        # Opening the file doubles as the existence check, so a hit costs
+        # no separate stat()
+        try:
+            fp = open(cache_path, "rb")
+        except FileNotFoundError:
+            if not self._migrate_legacy(url, cache_path):
+                return None
+            fp = open(cache_path, "rb")
+        from PIL import Image
+
         try:
-            image = Image.open(cache_path)
-            image.load()  # Force load image data into memory
-            return image
+            with fp:
+                image = Image.open(fp)
+                image.load()  # Force load image data into memory
+            self._remember(cache_path, image)
+            return image.copy()
         except Exception:
             # Corrupted cache file, remove it
             cache_path.unlink(missing_ok=True)
@@ -81,10 +207,27 @@ class ThumbnailCache:
             Path to cached file
         """
         cache_path = self.get_path(url)
-        # Save as PNG for lossless quality
-        image.save(cache_path, "PNG")
+        if not self._dir_ready:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+        image.save(cache_path, _CACHE_FORMAT, **_SAVE_OPTIONS)
+        # Overwriting an entry changes its size but not the directory mtime
+        self._stats = None
+        # The caller keeps (and may modify) the image it passed in
+        self._remember(cache_path, image.copy())
         return cache_path
 
+    def _remember(self, cache_path: Path, image: Image.Image) -> None:
+        """Keep a decoded image in memory, evicting the least recently used.
+
+        The image must not be shared with callers; get() hands out copies.
+        """
+        with self._images_lock:
+            self._images[cache_path] = image
+            self._images.move_to_end(cache_path)
+            while len(self._images) > self.MEMORY_CACHE_SIZE:
+                self._images.popitem(last=False)
+
     def process_and_save(self, url: str, data: bytes) -> Image.Image:
         """Process image data and save to cache.
         
@@ -97,21 +240,36 @@ class ThumbnailCache:
         Returns:
             Processed PIL Image
         """
-        image = Image.open(BytesIO(data))
+        from PIL import Image
+
+        # Target width for display - fits well in 80-char modal
+        target_width = 800
+        
+        # Thumbnails are nearly always JPEG; when the SOI marker says so,
+        # skip probing every registered format plugin
+        formats = ("JPEG",) if data[:2] == b"\xff\xd8" else None
+        image = Image.open(BytesIO(data), formats=formats)
+        
+        # JPEGs much larger than the target can be decoded straight at
+        # 1/2, 1/4 or 1/8 scale (never below the requested size); other
+        # formats ignore this
+        if image.width > target_width:
+            image.draft("RGB", (target_width, image.height * target_width // image.width))
         
         # Convert to RGB if needed
         if image.mode not in ('RGB', 'L'):
             image = image.convert('RGB')
         
-        # Target width for display - fits well in 80-char modal
-        target_width = 800
-        
-        # Scale to target width (up or down)
+        # Scale to target width (up or down). For big downscales,
+        # reducing_gap box-reduces by an integer factor first so Lanczos
+        # only runs over the last 3x
         if image.width != target_width:
             scale = target_width / image.width
             new_width = target_width
             new_height = int(image.height * scale)
-            image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            image = image.resize(
+                (new_width, new_height), Image.Resampling.LANCZOS, reducing_gap=3.0
+            )
         
         self.save(url, image)
         return image
@@ -122,18 +280,46 @@ class ThumbnailCache:
         Returns:
             Number of files removed.
         """
+        self._stats = None
+        self._legacy_names[self._cache_dir] = set()
+        with self._images_lock:
+            self._images.clear()
         count = 0
-        for f in self._cache_dir.glob("*.png"):
-            f.unlink()
+        for entry in self._cached_entries():
+            os.unlink(entry.path)
             count += 1
         return count
 
+    def _cached_entries(self) -> list[os.DirEntry]:
+        """List the thumbnail files in the cache directory."""
+        try:
+            with os.scandir(self._cache_dir) as entries:
+                return [e for e in entries if e.name.endswith(_CACHE_SUFFIXES)]
+        except FileNotFoundError:
+            return []
+
+    def _get_stats(self) -> tuple[int, int]:
+        """Get (total size, file count), rescanning only after changes.
+
+        Adding, removing or renaming entries bumps the directory mtime, so
+        a single stat() tells whether the last scan is still valid.
+        """
+        try:
+            mtime = self._cache_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return (0, 0)
+        if self._stats is None or mtime != self._stats_mtime:
+            entries = self._cached_entries()
+            self._stats = (sum(e.stat().st_size for e in entries), len(entries))
+            self._stats_mtime = mtime
+        return self._stats
+
     @property
     def size(self) -> int:
         """Get total cache size in bytes."""
-        return sum(f.stat().st_size for f in self._cache_dir.glob("*.png"))
+        return self._get_stats()[0]
 
     @property
     def count(self) -> int:
         """Get number of cached thumbnails."""
-        return len(list(self._cache_dir.glob("*.png")))
+        return self._get_stats()[1]
@@ -0,0 +1,24 @@
+"""Shared test configuration.
+
+Hypothesis example counts come from a profile rather than per-test
+settings. Pick one with HYPOTHESIS_PROFILE=<name> or
+pytest --hypothesis-profile=<name>:
+
+- ci: full run, 100 examples per property (the default)
+- dev: 25 examples, for quicker local iterations
+- fast: 10 examples and no example database, for a smoke check
+"""
+
+import os
+
+from hypothesis import HealthCheck, settings
+
+settings.register_profile("ci", max_examples=100)
+settings.register_profile("dev", max_examples=25)
+settings.register_profile(
+    "fast",
+    max_examples=10,
+    database=None,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "ci"))
@@ -0,0 +1,15 @@
+"""Hypothesis strategies shared by several test modules."""
+
+import string
+
+from hypothesis import strategies as st
+
+# Image references: registry hosts, paths, tags and digests only use these
+image_names = st.text(
+    st.characters(categories=("Ll", "Lu", "Nd"), include_characters="/:._-"),
+    min_size=1,
+    max_size=100,
+)
+
+# Job IDs end up in container names, which podman limits to ASCII
+job_ids = st.text(alphabet=string.ascii_letters + string.digits, min_size=1, max_size=20)
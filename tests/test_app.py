@@ -0,0 +1,68 @@
+"""Tests for app-level helpers."""
+
+import asyncio
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from dl_video import app
+
+
+@pytest.fixture
+def child_watcher(monkeypatch):
+    """Replace the child watcher API, which newer Pythons deprecate or drop."""
+    watcher_cls = MagicMock()
+    set_child_watcher = MagicMock()
+    monkeypatch.setattr(asyncio, "PidfdChildWatcher", watcher_cls, raising=False)
+    monkeypatch.setattr(asyncio, "set_child_watcher", set_child_watcher, raising=False)
+    return SimpleNamespace(cls=watcher_cls, set=set_child_watcher)
+
+
+def _platform(monkeypatch, version_info, platform, pidfd_open):
+    monkeypatch.setattr(app, "sys", SimpleNamespace(version_info=version_info, platform=platform))
+    monkeypatch.setattr(os, "pidfd_open", pidfd_open, raising=False)
+
+
+class TestPidfdChildWatcher:
+    """Tests for _use_pidfd_child_watcher."""
+
+    @pytest.mark.asyncio
+    async def test_installs_watcher_on_linux_311(self, monkeypatch, child_watcher):
+        """Python 3.11 on Linux with pidfd support gets a PidfdChildWatcher."""
+        # A real fd, so the probe's os.close() has something to close
+        pidfd_open = MagicMock(return_value=os.open(os.devnull, os.O_RDONLY))
+        _platform(monkeypatch, (3, 11, 7), "linux", pidfd_open)
+
+        app._use_pidfd_child_watcher()
+
+        pidfd_open.assert_called_once_with(os.getpid())
+        watcher = child_watcher.cls.return_value
+        watcher.attach_loop.assert_called_once_with(asyncio.get_running_loop())
+        child_watcher.set.assert_called_once_with(watcher)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "version_info,platform,pidfd_error",
+        [
+            ((3, 12, 0), "linux", None),
+            ((3, 11, 7), "darwin", None),
+            ((3, 11, 7), "win32", None),
+            ((3, 11, 7), "linux", OSError(38, "Function not implemented")),
+        ],
+        ids=["python-3.12", "macos", "windows", "old-kernel"],
+    )
+    async def test_keeps_default_watcher(
+        self, monkeypatch, child_watcher, version_info, platform, pidfd_error
+    ):
+        """Newer Pythons, other platforms and kernels without pidfds are left alone."""
+        pidfd_open = MagicMock(side_effect=pidfd_error)
+        _platform(monkeypatch, version_info, platform, pidfd_open)
+
+        app._use_pidfd_child_watcher()
+
+        if pidfd_error is None:
+            pidfd_open.assert_not_called()
+        child_watcher.cls.assert_not_called()
+        child_watcher.set.assert_not_called()
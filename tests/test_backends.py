@@ -7,40 +7,69 @@ Validates: Requirements 3.3, 4.3
 
 import asyncio
 import sys
+from unittest.mock import AsyncMock, patch
 
 import pytest
-from hypothesis import given, settings
+from hypothesis import given
 from hypothesis import strategies as st
 
 from dl_video.services.backends import LocalBackend
+from tests.strategies import image_names, job_ids
+
+
+def _alnum_text(max_size: int) -> st.SearchStrategy[str]:
+    """Non-empty alphanumeric text, drawn from letters and numbers directly.
+
+    Every character in the Unicode letter and number categories is
+    isalnum(), so nothing needs filtering out. Filtering arbitrary text
+    instead rejected most examples.
+    """
+    return st.text(st.characters(categories=("L", "N")), min_size=1, max_size=max_size)
+
+
+# Path segments: alphanumeric names or the separators "/", "_" and "-"
+_path_segments = st.one_of(_alnum_text(50), st.sampled_from(["/", "_", "-", "/_", "_-", "/_-"]))
+
+
+def _output_process(output: bytes, chunk_size: int):
+    """Mock a process whose stdout delivers output in chunk_size pieces."""
+    chunks = iter([output[i:i + chunk_size] for i in range(0, len(output), chunk_size)])
+
+    async def read_stdout(_size=-1):
+        return next(chunks, b"")
+
+    process = AsyncMock()
+    process.stdout = AsyncMock()
+    process.stdout.read = read_stdout
+    process.wait = AsyncMock(return_value=0)
+    return process
 
 
 class TestLocalBackendProperties:
     """Property-based tests for LocalBackend."""
 
     @pytest.mark.asyncio
-    @given(st.lists(st.text(min_size=1, max_size=50).filter(lambda x: "\n" not in x and "\r" not in x), min_size=1, max_size=20))
-    @settings(max_examples=100)
-    async def test_progress_line_streaming_order(self, lines: list[str]) -> None:
+    @given(
+        st.lists(st.text(min_size=1, max_size=50).filter(lambda x: "\n" not in x and "\r" not in x), min_size=1, max_size=20),
+        st.integers(min_value=1, max_value=64),
+    )
+    async def test_progress_line_streaming_order(self, lines: list[str], chunk_size: int) -> None:
         """Property 5: Progress Line Streaming.
 
         For any sequence of output lines produced by a command, the execute()
         async iterator should yield each line in the same order they were produced.
+        The pipe is mocked so every example doesn't start an interpreter; the
+        random chunk size splits lines (and UTF-8 sequences) across reads.
 
         **Validates: Requirements 3.3, 4.3**
         """
         backend = LocalBackend()
-
-        # Create a Python command that prints the lines in order
-        # We use repr() to safely encode the lines for the command
-        lines_repr = repr(lines)
-        python_code = f"import sys; lines = {lines_repr}; [print(line, flush=True) for line in lines]"
-
-        command = [sys.executable, "-c", python_code]
+        output = "".join(f"{line}\n" for line in lines).encode()
 
         collected_lines: list[str] = []
-        async for output_line in backend.execute(command):
-            collected_lines.append(output_line)
+        with patch("asyncio.create_subprocess_exec", return_value=_output_process(output, chunk_size)):
+            async for output_line in backend.execute(["yt-dlp"]):
+                collected_lines.append(output_line)
 
         assert collected_lines == lines, (
             f"Lines not in expected order.\n"
@@ -48,6 +77,17 @@ class TestLocalBackendProperties:
             f"Got: {collected_lines}"
         )
 
+    @pytest.mark.asyncio
+    async def test_streams_real_process_output(self) -> None:
+        """Lines from a real subprocess arrive in order, without line endings."""
+        backend = LocalBackend()
+        lines = ["[download]   0.0%", "[download]  50.0%", "", "[download] 100%"]
+        python_code = f"lines = {lines!r}; [print(line, flush=True) for line in lines]"
+
+        collected_lines = [line async for line in backend.execute([sys.executable, "-c", python_code])]
+
+        assert collected_lines == lines
+
     @pytest.mark.asyncio
     async def test_is_available_returns_true(self) -> None:
         """LocalBackend should always be available."""
@@ -145,8 +185,7 @@ from dl_video.services.backends import PodmanBackend
 class TestPodmanBackendProperties:
     """Property-based tests for PodmanBackend."""
 
-    @given(st.text(min_size=1, max_size=100).filter(lambda x: "/" in x or ":" in x or x.isalnum()))
-    @settings(max_examples=100)
+    @given(image_names)
     def test_custom_image_configuration(self, image_name: str) -> None:
         """Property 3: Custom Image Configuration.
 
@@ -163,23 +202,17 @@ class TestPodmanBackendProperties:
             f"Image name '{image_name}' not found in command: {command}"
         )
 
-        # The image should be the second-to-last element before the actual command
-        # Find where the image is in the command
-        image_index = command.index(image_name)
-        # Everything after the image should be the command
-        assert command[image_index + 1:] == ["echo", "test"]
+        # The image comes right before the command. Check by position: a
+        # name like "run" also matches podman's own arguments
+        assert command[-3:] == [image_name, "echo", "test"]
 
     @given(
         st.lists(
-            st.tuples(
-                st.text(min_size=1, max_size=50).filter(lambda x: x.isalnum() or x in "/_-"),
-                st.text(min_size=1, max_size=50).filter(lambda x: x.isalnum() or x in "/_-"),
-            ),
+            st.tuples(_path_segments, _path_segments),
             min_size=1,
             max_size=5,
         )
     )
-    @settings(max_examples=100)
     def test_volume_mount_construction(self, mount_pairs: list[tuple[str, str]]) -> None:
         """Property 4: Volume Mount Construction.
 
@@ -230,8 +263,7 @@ class TestPodmanBackendProperties:
 
         assert "--rm" in command, f"--rm flag not found in command: {command}"
 
-    @given(st.text(min_size=1, max_size=20).filter(lambda x: x.isalnum()))
-    @settings(max_examples=100)
+    @given(job_ids)
     def test_unique_container_naming(self, job_id: str) -> None:
         """Property 8: Unique Container Naming.
 
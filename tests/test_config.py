@@ -9,10 +9,11 @@ Property 1: Configuration Persistence Round-Trip
 Validates: Requirements 1.4
 """
 
-import tempfile
+import uuid
 from pathlib import Path
 
-from hypothesis import given, settings
+import pytest
+from hypothesis import given
 from hypothesis import strategies as st
 
 from dl_video.models import Config
@@ -38,12 +39,17 @@ config_strategy = st.builds(
 )
 
 
+@pytest.fixture(scope="class")
+def config_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One directory shared by every example; each example uses its own file."""
+    return tmp_path_factory.mktemp("config")
+
+
 class TestConfigManagerProperties:
     """Property-based tests for ConfigManager."""
 
     @given(config_strategy)
-    @settings(max_examples=100)
-    def test_configuration_round_trip(self, config: Config) -> None:
+    def test_configuration_round_trip(self, config_dir: Path, config: Config) -> None:
         """Property 4: Configuration Round-Trip.
 
         For any valid Config object, saving it to disk and loading it back
@@ -51,30 +57,28 @@ class TestConfigManagerProperties:
 
         **Validates: Requirements 10.1, 10.2**
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "config.json"
-            manager = ConfigManager(config_path=config_path)
-
-            # Save the config
-            manager.save(config)
-
-            # Load it back
-            loaded_config = manager.load()
-
-            # Verify equivalence
-            assert loaded_config.download_dir == config.download_dir, (
-                f"download_dir mismatch: expected {config.download_dir}, got {loaded_config.download_dir}"
-            )
-            assert loaded_config.auto_upload == config.auto_upload, (
-                f"auto_upload mismatch: expected {config.auto_upload}, got {loaded_config.auto_upload}"
-            )
-            assert loaded_config.skip_conversion == config.skip_conversion, (
-                f"skip_conversion mismatch: expected {config.skip_conversion}, got {loaded_config.skip_conversion}"
-            )
+        config_path = config_dir / f"config_{uuid.uuid4().hex}.json"
+        manager = ConfigManager(config_path=config_path)
+
+        # Save the config
+        manager.save(config)
+
+        # Load it back
+        loaded_config = manager.load()
+
+        # Verify equivalence
+        assert loaded_config.download_dir == config.download_dir, (
+            f"download_dir mismatch: expected {config.download_dir}, got {loaded_config.download_dir}"
+        )
+        assert loaded_config.auto_upload == config.auto_upload, (
+            f"auto_upload mismatch: expected {config.auto_upload}, got {loaded_config.auto_upload}"
+        )
+        assert loaded_config.skip_conversion == config.skip_conversion, (
+            f"skip_conversion mismatch: expected {config.skip_conversion}, got {loaded_config.skip_conversion}"
+        )
 
     @given(config_strategy)
-    @settings(max_examples=100)
-    def test_container_config_round_trip(self, config: Config) -> None:
+    def test_container_config_round_trip(self, config_dir: Path, config: Config) -> None:
         """Property 1: Configuration Persistence Round-Trip for container settings.
 
         For any valid Config object with execution_backend and container_image values,
@@ -83,23 +87,36 @@ class TestConfigManagerProperties:
         **Feature: podman-container-integration, Property 1: Configuration Persistence Round-Trip**
         **Validates: Requirements 1.4**
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "config.json"
-            manager = ConfigManager(config_path=config_path)
-
-            # Save the config
-            manager.save(config)
-
-            # Load it back
-            loaded_config = manager.load()
-
-            # Verify container settings equivalence
-            assert loaded_config.execution_backend == config.execution_backend, (
-                f"execution_backend mismatch: expected {config.execution_backend}, got {loaded_config.execution_backend}"
-            )
-            assert loaded_config.container_image == config.container_image, (
-                f"container_image mismatch: expected {config.container_image}, got {loaded_config.container_image}"
-            )
-            assert loaded_config.cookies_browser == config.cookies_browser, (
-                f"cookies_browser mismatch: expected {config.cookies_browser}, got {loaded_config.cookies_browser}"
-            )
+        config_path = config_dir / f"config_{uuid.uuid4().hex}.json"
+        manager = ConfigManager(config_path=config_path)
+
+        # Save the config
+        manager.save(config)
+
+        # Load it back
+        loaded_config = manager.load()
+
+        # Verify container settings equivalence
+        assert loaded_config.execution_backend == config.execution_backend, (
+            f"execution_backend mismatch: expected {config.execution_backend}, got {loaded_config.execution_backend}"
+        )
+        assert loaded_config.container_image == config.container_image, (
+            f"container_image mismatch: expected {config.container_image}, got {loaded_config.container_image}"
+        )
+        assert loaded_config.cookies_browser == config.cookies_browser, (
+            f"cookies_browser mismatch: expected {config.cookies_browser}, got {loaded_config.cookies_browser}"
+        )
+
+
+def test_load_reuses_parsed_config_until_file_changes(tmp_path: Path) -> None:
+    """load() parses once per file version and hands out independent copies."""
+    config_path = tmp_path / "config.json"
+    config_path.write_text('{"auto_upload": true}')
+    manager = ConfigManager(config_path=config_path)
+
+    first = manager.load()
+    first.auto_upload = False
+    assert manager.load().auto_upload is True
+
+    config_path.write_text('{"auto_upload": false, "skip_conversion": true}')
+    assert manager.load().skip_conversion is True
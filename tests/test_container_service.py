@@ -8,19 +8,25 @@ Validates: Requirements 1.2, 1.3
 from pathlib import Path
 
 import pytest
-from hypothesis import given, settings
-from hypothesis import strategies as st
+from hypothesis import given
 
 from dl_video.models import BackendType
 from dl_video.services.backends import LocalBackend, PodmanBackend
 from dl_video.services.container_service import ContainerService
+from tests.strategies import image_names, job_ids
+
+
+def _find_arg(command: list[str], flag: str) -> str | None:
+    """Return the value following flag in command, or None if it's absent."""
+    if flag not in command:
+        return None
+    return command[command.index(flag) + 1]
 
 
 class TestContainerServiceProperties:
     """Property-based tests for ContainerService."""
 
-    @given(st.sampled_from([BackendType.LOCAL, BackendType.CONTAINER]))
-    @settings(max_examples=10)  # Only 2 possible values
+    @pytest.mark.parametrize("backend_type", list(BackendType))
     def test_backend_routing_based_on_configuration(self, backend_type: BackendType) -> None:
         """Property 2: Backend Routing Based on Configuration.
 
@@ -44,8 +50,7 @@ class TestContainerServiceProperties:
                 f"got {type(backend).__name__}"
             )
 
-    @given(st.sampled_from([BackendType.LOCAL, BackendType.CONTAINER]))
-    @settings(max_examples=10)  # Only 2 possible values
+    @pytest.mark.parametrize("backend_type", list(BackendType))
     def test_set_backend_changes_routing(self, backend_type: BackendType) -> None:
         """Setting backend type should change which backend is returned.
 
@@ -81,8 +86,7 @@ class TestContainerServiceProperties:
         service.set_backend(BackendType.LOCAL)
         assert service.backend_type == BackendType.LOCAL
 
-    @given(st.text(min_size=1, max_size=50).filter(lambda x: "/" in x or ":" in x or x.isalnum()))
-    @settings(max_examples=50)
+    @given(image_names)
     def test_container_image_passed_to_podman_backend(self, image_name: str) -> None:
         """Custom container image should be passed to PodmanBackend.
 
@@ -100,8 +104,7 @@ class TestContainerServiceProperties:
             f"Container image '{image_name}' not found in podman command: {command}"
         )
 
-    @given(st.text(min_size=1, max_size=20).filter(lambda x: x.isalnum()))
-    @settings(max_examples=50)
+    @given(job_ids)
     def test_job_id_passed_to_backend(self, job_id: str) -> None:
         """Job ID should be passed to backend for unique container naming.
 
@@ -113,12 +116,7 @@ class TestContainerServiceProperties:
         assert isinstance(backend, PodmanBackend)
         command = backend.get_podman_command(["echo", "test"])
 
-        name_value = None
-        for i, arg in enumerate(command):
-            if arg == "--name" and i + 1 < len(command):
-                name_value = command[i + 1]
-                break
-
+        name_value = _find_arg(command, "--name")
         assert name_value is not None, f"--name not found in command: {command}"
         assert job_id in name_value, (
             f"Job ID '{job_id}' not found in container name: {name_value}"
@@ -135,39 +133,22 @@ class TestCookiesCommandConstruction:
     Validates: Requirements 3.5
     """
 
-    @given(
-        st.sampled_from(["chrome", "firefox", "safari", "edge", "brave", "chromium", "opera"]),
+    @pytest.mark.parametrize(
+        "cookies_browser", [None, "chrome", "firefox", "safari", "edge", "brave", "chromium", "opera"]
     )
-    @settings(max_examples=20)
-    def test_cookies_argument_construction(self, cookies_browser: str) -> None:
-        """Verify cookies argument is correctly added to command.
-
-        **Validates: Requirements 3.5**
-        """
-        command = ["yt-dlp"]
-        if cookies_browser:
-            command.extend(["--cookies-from-browser", cookies_browser])
-        command.extend(["--newline", "-o", "/downloads/test.%(ext)s", "https://example.com/video"])
-
-        assert "--cookies-from-browser" in command
-        cookies_index = command.index("--cookies-from-browser")
-        assert command[cookies_index + 1] == cookies_browser
-
-    def test_no_cookies_argument_when_none(self) -> None:
-        """When cookies_browser is None, no cookies argument should be added.
+    def test_cookies_argument_construction(self, cookies_browser: str | None) -> None:
+        """Cookies argument is added for a browser and left out for None.
 
         **Validates: Requirements 3.5**
         """
-        cookies_browser = None
         command = ["yt-dlp"]
         if cookies_browser:
             command.extend(["--cookies-from-browser", cookies_browser])
         command.extend(["--newline", "-o", "/downloads/test.%(ext)s", "https://example.com/video"])
 
-        assert "--cookies-from-browser" not in command
+        assert _find_arg(command, "--cookies-from-browser") == cookies_browser
 
-    @given(st.sampled_from(["chrome", "firefox", "safari", "edge", "brave"]))
-    @settings(max_examples=10)
+    @pytest.mark.parametrize("cookies_browser", ["chrome", "firefox", "safari", "edge", "brave"])
     def test_cookies_passthrough_in_podman_command(self, cookies_browser: str) -> None:
         """Verify cookies are included in podman command.
 
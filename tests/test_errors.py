@@ -5,8 +5,6 @@ Tests error detection and user-friendly message formatting.
 Validates: Requirements 6.1, 6.2, 6.3
 """
 
-import pytest
-
 from dl_video.services.errors import (
     ContainerError,
     ContainerErrorType,
@@ -204,6 +202,20 @@ class TestErrorDetectionFromOutput:
         assert error is not None
         assert error.error_type == ContainerErrorType.VOLUME_MOUNT_PERMISSION
 
+    def test_permission_denied_path_keeps_case(self) -> None:
+        """Extracted paths match case-insensitively but keep their case."""
+        output = "Error: Permission Denied: /Home/User/Downloads"
+        error = detect_error_from_output(output)
+        assert error is not None
+        assert "/Home/User/Downloads" in error.message
+
+    def test_no_such_file_path_extracted(self) -> None:
+        """The missing path is pulled out of the error line."""
+        output = "Error: No such file or directory: /Missing/Path"
+        error = detect_error_from_output(output)
+        assert error is not None
+        assert "/Missing/Path" in error.message
+
     def test_detect_selinux_error(self) -> None:
         """Should detect SELinux errors."""
         output = "SELinux is preventing access to /data"
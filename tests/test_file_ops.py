@@ -0,0 +1,36 @@
+"""Tests for file operation utilities."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from dl_video.utils.file_ops import write_atomic
+
+
+class TestWriteAtomic:
+    """Tests for write_atomic."""
+
+    def test_replaces_contents(self, tmp_path):
+        """The file ends up with exactly the new data and no temporary file is left."""
+        path = tmp_path / "history.json"
+        path.write_bytes(b"old contents that are longer")
+
+        with patch("os.fsync", wraps=os.fsync) as fsync:
+            write_atomic(path, b"new")
+
+        fsync.assert_called_once()
+        assert path.read_bytes() == b"new"
+        assert os.listdir(tmp_path) == ["history.json"]
+
+    def test_failed_write_keeps_old_contents(self, tmp_path):
+        """If the rename fails, the old file is untouched and the temp file removed."""
+        path = tmp_path / "config.json"
+        path.write_bytes(b"old")
+
+        with patch("os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                write_atomic(path, b"new")
+
+        assert path.read_bytes() == b"old"
+        assert os.listdir(tmp_path) == ["config.json"]
@@ -0,0 +1,187 @@
+"""Tests for HistoryManager."""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from dl_video.utils import history
+from dl_video.utils.history import HistoryManager, HistoryRecord, MetadataRecord
+
+
+def _record(source_url: str, upload_url: str | None = None) -> HistoryRecord:
+    return HistoryRecord.create(
+        filename="video.mp4",
+        source_url=source_url,
+        file_path=f"/tmp/{source_url.rsplit('/', 1)[-1]}.mp4",
+        upload_url=upload_url,
+    )
+
+
+def _saved_urls(history_file) -> list[str]:
+    return [r["source_url"] for r in json.loads(history_file.read_bytes())["history"]]
+
+
+@pytest.fixture
+def history_file(tmp_path):
+    return tmp_path / "history.json"
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    """Record the paths passed to write_atomic, still writing them."""
+    calls = []
+    write_atomic = history.write_atomic
+
+    def recording_write(path, data):
+        calls.append(path)
+        write_atomic(path, data)
+
+    monkeypatch.setattr(history, "write_atomic", recording_write)
+    return calls
+
+
+class TestHistoryManager:
+    """Tests for HistoryManager."""
+
+    def test_round_trip_with_metadata(self, history_file):
+        """Records, including metadata, load back as they were saved."""
+        manager = HistoryManager(history_file)
+        manager.add(HistoryRecord.create(
+            filename="clip.mp4",
+            source_url="https://youtube.com/watch?v=a",
+            file_path="/tmp/clip.mp4",
+            file_size=1234,
+            upload_url="https://example.com/clip.mp4",
+            metadata=MetadataRecord(title="Clip", duration=61, tags=["a", "b"], fps=29.97),
+        ))
+        manager.add(_record("https://youtube.com/watch?v=b"))
+
+        loaded = HistoryManager(history_file)
+
+        assert list(loaded.get_all()) == list(manager.get_all())
+        assert loaded.get_all()[1].metadata.formatted_duration == "1:01"
+
+    def test_find_returns_newest_record(self, history_file):
+        """Lookups by URL find the most recent record, and nothing after clear()."""
+        manager = HistoryManager(history_file)
+        first = _record("https://youtube.com/watch?v=a", "https://example.com/1")
+        second = _record("https://youtube.com/watch?v=a", "https://example.com/2")
+        manager.add(first)
+        manager.add(second)
+
+        assert manager.find_by_source("https://youtube.com/watch?v=a") is second
+        assert manager.find_by_upload("https://example.com/1") is first
+        assert manager.find_by_upload("https://example.com/2") is second
+        assert list(manager.get_all()) == [second, first]
+
+        manager.clear()
+
+        assert manager.find_by_source("https://youtube.com/watch?v=a") is None
+        assert manager.find_by_upload("https://example.com/2") is None
+        assert manager.count == 0
+
+        manager.add(first)
+        assert manager.find_by_source("https://youtube.com/watch?v=a") is first
+
+    @pytest.mark.asyncio
+    async def test_changes_written_once_after_delay(self, history_file, writes):
+        """Several changes in a row are written together once things go quiet."""
+        manager = HistoryManager(history_file)
+        manager.FLUSH_DELAY = 0.01
+        for name in "abc":
+            manager.add(_record(f"https://youtube.com/watch?v={name}"))
+
+        assert writes == []
+
+        await asyncio.sleep(0.05)
+        await manager._flush_task
+
+        assert writes == [history_file]
+        assert _saved_urls(history_file) == [
+            "https://youtube.com/watch?v=c",
+            "https://youtube.com/watch?v=b",
+            "https://youtube.com/watch?v=a",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_immediately(self, history_file, writes):
+        """flush() writes pending changes without waiting for the delay."""
+        manager = HistoryManager(history_file)
+        manager.FLUSH_DELAY = 0.01
+        manager.add(_record("https://youtube.com/watch?v=a"))
+
+        await manager.flush()
+        assert writes == [history_file]
+
+        # The scheduled write was cancelled, not just left with nothing to do
+        await asyncio.sleep(0.05)
+        assert manager._flush_task is None
+
+    @pytest.mark.asyncio
+    async def test_change_during_write_goes_out_next(self, history_file, monkeypatch):
+        """A change made while a write is running gets a write of its own."""
+        manager = HistoryManager(history_file)
+        manager.add(_record("https://youtube.com/watch?v=a"))
+        loop = asyncio.get_running_loop()
+        written = []
+        write_atomic = history.write_atomic
+
+        def slow_write(path, data):
+            if not written:
+                loop.call_soon_threadsafe(manager.add, _record("https://youtube.com/watch?v=b"))
+                time.sleep(0.05)
+            write_atomic(path, data)
+            written.append(_saved_urls(path))
+
+        monkeypatch.setattr(history, "write_atomic", slow_write)
+        await manager.flush()
+
+        assert written == [
+            ["https://youtube.com/watch?v=a"],
+            ["https://youtube.com/watch?v=b", "https://youtube.com/watch?v=a"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_flush_reports_write_errors(self, history_file, monkeypatch):
+        """A failed write is reported and retried with the next flush."""
+        errors = []
+        manager = HistoryManager(history_file, on_save_error=errors.append)
+        manager.add(_record("https://youtube.com/watch?v=a"))
+        write_atomic = history.write_atomic
+
+        def failing_write(path, data):
+            raise OSError(28, "No space left on device")
+
+        monkeypatch.setattr(history, "write_atomic", failing_write)
+        await manager.flush()
+
+        assert len(errors) == 1
+        assert errors[0].errno == 28
+        assert not history_file.exists()
+
+        monkeypatch.setattr(history, "write_atomic", write_atomic)
+        await manager.flush()
+
+        assert _saved_urls(history_file) == ["https://youtube.com/watch?v=a"]
+
+    def test_get_all_is_live_and_snapshot_is_not(self, history_file):
+        """get_all() follows later add()/clear() calls; snapshot() keeps its contents."""
+        manager = HistoryManager(history_file)
+        first = _record("https://youtube.com/watch?v=a")
+        manager.add(first)
+        view = manager.get_all()
+        snapshot = manager.snapshot()
+
+        second = _record("https://youtube.com/watch?v=b")
+        manager.add(second)
+        assert list(view) == [second, first]
+        assert snapshot == (first,)
+
+        manager.clear()
+        assert list(view) == []
+        assert snapshot == (first,)
+
+        manager.add(first)
+        assert list(view) == [first]
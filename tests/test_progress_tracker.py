@@ -5,7 +5,7 @@
 """
 
 import pytest
-from hypothesis import given, strategies as st, assume, settings
+from hypothesis import given, strategies as st, assume
 
 from dl_video.progress_tracker import (
     ProgressBoundsError,
@@ -26,7 +26,6 @@ class TestProgressTrackerProperties:
     """Property-based tests for ProgressTracker."""
 
     @given(st.lists(valid_progress, min_size=1, max_size=50))
-    @settings(max_examples=100)
     def test_progress_bounds_always_valid(
         self, progress_values: list[float]
     ) -> None:
@@ -52,7 +51,6 @@ class TestProgressTrackerProperties:
             assert tracker.current == value
 
     @given(invalid_progress_low)
-    @settings(max_examples=100)
     def test_progress_rejects_values_below_zero(self, value: float) -> None:
         """
         *For any* progress value below 0, the tracker SHALL reject it with
@@ -70,7 +68,6 @@ class TestProgressTrackerProperties:
         assert tracker.current == 0.0
 
     @given(invalid_progress_high)
-    @settings(max_examples=100)
     def test_progress_rejects_values_above_hundred(self, value: float) -> None:
         """
         *For any* progress value above 100, the tracker SHALL reject it with
@@ -91,7 +88,6 @@ class TestProgressTrackerProperties:
         st.floats(min_value=50.0, max_value=100.0, allow_nan=False),
         st.floats(min_value=0.0, max_value=49.9, allow_nan=False),
     )
-    @settings(max_examples=100)
     def test_progress_rejects_regression(
         self, first_value: float, second_value: float
     ) -> None:
@@ -115,7 +111,6 @@ class TestProgressTrackerProperties:
         assert tracker.current == first_value
 
     @given(valid_progress)
-    @settings(max_examples=100)
     def test_progress_allows_equal_values(self, value: float) -> None:
         """
         *For any* valid progress value, updating with the same value twice
@@ -131,7 +126,6 @@ class TestProgressTrackerProperties:
         assert tracker.current == value
 
     @given(st.lists(valid_progress, min_size=2, max_size=20))
-    @settings(max_examples=100)
     def test_history_is_monotonically_non_decreasing(
         self, progress_values: list[float]
     ) -> None:
@@ -158,7 +152,6 @@ class TestProgressTrackerProperties:
             )
 
     @given(valid_progress)
-    @settings(max_examples=100)
     def test_validate_bounds_consistency(self, value: float) -> None:
         """
         *For any* value, validate_bounds() SHALL return True if and only if
@@ -172,7 +165,6 @@ class TestProgressTrackerProperties:
         assert tracker.validate_bounds(value) is True
 
     @given(invalid_progress_low)
-    @settings(max_examples=100)
     def test_validate_bounds_rejects_low(self, value: float) -> None:
         """
         *For any* value below 0, validate_bounds() SHALL return False.
@@ -183,7 +175,6 @@ class TestProgressTrackerProperties:
         assert tracker.validate_bounds(value) is False
 
     @given(invalid_progress_high)
-    @settings(max_examples=100)
     def test_validate_bounds_rejects_high(self, value: float) -> None:
         """
         *For any* value above 100, validate_bounds() SHALL return False.
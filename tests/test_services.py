@@ -2,14 +2,35 @@
 
 import asyncio
 import json
-from pathlib import Path
+import os
+import signal
+import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from dl_video.services.converter import ConversionError, VideoConverter
 from dl_video.services.downloader import DownloadError, VideoDownloader
-from dl_video.services.uploader import FileUploader, UploadError
+from dl_video.services.uploader import FileUploader, UploadError, _multipart_envelope
+
+
+def _metadata_process(stdout: bytes = b"", stderr: bytes = b"", returncode: int = 0, delay: float = 0):
+    """Mock a yt-dlp metadata process whose pipes yield the given output."""
+    chunks = iter([stdout])
+
+    async def read_stdout(_size=-1):
+        await asyncio.sleep(delay)
+        return next(chunks, b"")
+
+    process = AsyncMock()
+    process.stdout = AsyncMock()
+    process.stdout.read = read_stdout
+    process.stderr = AsyncMock()
+    process.stderr.read = AsyncMock(side_effect=[stderr, b""])
+    process.wait = AsyncMock()
+    process.returncode = returncode
+    return process
 
 
 class TestVideoDownloader:
@@ -17,8 +38,12 @@ class TestVideoDownloader:
 
     @pytest.fixture
     def downloader(self):
-        """Create a VideoDownloader instance."""
-        return VideoDownloader()
+        """Create a VideoDownloader instance with an empty metadata cache."""
+        VideoDownloader.clear_cache()
+        # Mocked processes report pid 1; don't renice a real process
+        with patch("dl_video.services.downloader._lower_priority"):
+            yield VideoDownloader()
+        VideoDownloader.clear_cache()
 
     @pytest.mark.asyncio
     async def test_get_metadata_success(self, downloader):
@@ -29,11 +54,7 @@ class TestVideoDownloader:
             "uploader": "Test User",
         }
 
-        mock_process = AsyncMock()
-        mock_process.communicate = AsyncMock(
-            return_value=(json.dumps(mock_metadata).encode(), b"")
-        )
-        mock_process.returncode = 0
+        mock_process = _metadata_process(json.dumps(mock_metadata).encode())
 
         with patch("asyncio.create_subprocess_exec", return_value=mock_process):
             metadata = await downloader.get_metadata("https://youtube.com/watch?v=test")
@@ -45,11 +66,7 @@ class TestVideoDownloader:
     @pytest.mark.asyncio
     async def test_get_metadata_failure(self, downloader):
         """Test metadata fetch failure."""
-        mock_process = AsyncMock()
-        mock_process.communicate = AsyncMock(
-            return_value=(b"", b"Video unavailable")
-        )
-        mock_process.returncode = 1
+        mock_process = _metadata_process(stderr=b"Video unavailable", returncode=1)
 
         with patch("asyncio.create_subprocess_exec", return_value=mock_process):
             with pytest.raises(DownloadError) as exc_info:
@@ -57,6 +74,17 @@ class TestVideoDownloader:
 
         assert "Failed to fetch metadata" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_get_metadata_failure_with_truncated_utf8(self, downloader):
+        """A stderr tail cut inside a multi-byte character still raises DownloadError."""
+        mock_process = _metadata_process(stderr="é".encode()[1:] + b" Video unavailable", returncode=1)
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+            with pytest.raises(DownloadError) as exc_info:
+                await downloader.get_metadata("https://youtube.com/watch?v=invalid")
+
+        assert "Video unavailable" in str(exc_info.value)
+
     @pytest.mark.asyncio
     async def test_get_metadata_ytdlp_not_installed(self, downloader):
         """Test error when yt-dlp is not installed."""
@@ -68,6 +96,167 @@ class TestVideoDownloader:
 
         assert "yt-dlp is not installed" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_get_metadata_cached(self, downloader):
+        """Repeat lookups are served from cache until invalidated."""
+        output = json.dumps({"title": "Cached"}).encode()
+        url = "https://youtube.com/watch?v=cached"
+
+        with patch(
+            "asyncio.create_subprocess_exec", side_effect=lambda *a, **kw: _metadata_process(output)
+        ) as mock_exec:
+            first = await downloader.get_metadata(url)
+            second = await VideoDownloader().get_metadata(url)
+            assert mock_exec.call_count == 1
+
+            VideoDownloader.invalidate(url)
+            await downloader.get_metadata(url)
+            assert mock_exec.call_count == 2
+
+        assert first is second
+
+    @pytest.mark.asyncio
+    async def test_get_metadata_fast_path(self, downloader):
+        """fast=True uses the lightweight command and reuses full results."""
+        output = json.dumps({"title": "Fast"}).encode()
+
+        with patch(
+            "asyncio.create_subprocess_exec", side_effect=lambda *a, **kw: _metadata_process(output)
+        ) as mock_exec:
+            await downloader.get_metadata("https://youtube.com/watch?v=fast", fast=True)
+            assert "--flat-playlist" in mock_exec.call_args.args
+
+            full = await downloader.get_metadata("https://youtube.com/watch?v=full")
+            assert "--flat-playlist" not in mock_exec.call_args.args
+            fast = await downloader.get_metadata("https://youtube.com/watch?v=full", fast=True)
+
+        assert mock_exec.call_count == 2
+        assert fast is full
+
+    @pytest.mark.asyncio
+    async def test_prefetch_warms_cache_and_ignores_failures(self, downloader):
+        """Prefetched URLs are served from cache; failed ones are skipped."""
+        async def fake_exec(*args, **kwargs):
+            if args[-1].endswith("bad"):
+                return _metadata_process(stderr=b"Video unavailable", returncode=1)
+            return _metadata_process(json.dumps({"title": args[-1]}).encode())
+
+        urls = ["https://youtube.com/watch?v=a", "https://youtube.com/watch?v=bad"]
+        with patch("asyncio.create_subprocess_exec", side_effect=fake_exec) as mock_exec:
+            await downloader.prefetch(urls)
+            metadata = await downloader.get_metadata(urls[0])
+
+        assert metadata.title == urls[0]
+        assert mock_exec.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_prefetch_serves_job_lookup(self):
+        """A prefetch by one downloader saves the job's own yt-dlp run."""
+        url = "https://youtube.com/watch?v=prefetched"
+        prefetcher = VideoDownloader()
+        prefetcher.set_cookies_browser("firefox")
+        job_downloader = VideoDownloader(cookies_browser="firefox")
+
+        with patch(
+            "asyncio.create_subprocess_exec",
+            return_value=_metadata_process(json.dumps({"title": "Prefetched"}).encode()),
+        ) as mock_exec:
+            await prefetcher.prefetch([url])
+            metadata = await job_downloader.get_metadata(url)
+
+        assert metadata.title == "Prefetched"
+        mock_exec.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cancel_prefetch_stops_running_lookup(self, downloader):
+        """Cancelling the only caller kills the yt-dlp run it started."""
+        process = _metadata_process(b"{}", delay=10)
+        process.returncode = None
+        process.kill = MagicMock()
+
+        with patch("asyncio.create_subprocess_exec", return_value=process):
+            task = asyncio.create_task(downloader.prefetch(["https://youtube.com/watch?v=slow"]))
+            await asyncio.sleep(0.01)
+            downloader.cancel_prefetch()
+            await task
+            await asyncio.sleep(0.01)
+
+        process.kill.assert_called_once()
+        assert not VideoDownloader._metadata_inflight
+
+    @pytest.mark.asyncio
+    async def test_get_metadata_many(self, downloader):
+        """Batch lookups keep URL order and return failures in place."""
+        urls = [
+            "https://youtube.com/watch?v=a",
+            "https://youtube.com/watch?v=bad",
+            "https://youtube.com/watch?v=b",
+        ]
+
+        async def fake_exec(*args, **kwargs):
+            if "--batch-file" in args:
+                # The batch run skips the URL it can't extract
+                output = b"".join(
+                    json.dumps({"title": url, "original_url": url}).encode() + b"\n"
+                    for url in urls if not url.endswith("bad")
+                )
+                process = _metadata_process(output)
+                process.stdin = MagicMock()
+                process.stdin.drain = AsyncMock()
+                return process
+            if args[-1].endswith("bad"):
+                return _metadata_process(stderr=b"Video unavailable", returncode=1)
+            return _metadata_process(json.dumps({"title": args[-1]}).encode())
+
+        with patch("asyncio.create_subprocess_exec", side_effect=fake_exec) as mock_exec:
+            results = await downloader.get_metadata_many(urls, concurrency=2)
+
+        assert results[0].title == urls[0]
+        assert isinstance(results[1], DownloadError)
+        assert results[2].title == urls[2]
+        # One batch process, then a retry only for the URL it couldn't resolve
+        assert mock_exec.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_metadata_batch(self, downloader):
+        """One yt-dlp process serves every URL and fills the cache."""
+        urls = ["https://youtube.com/watch?v=a", "https://youtube.com/watch?v=b"]
+        output = b"".join(
+            json.dumps({"title": url[-1], "original_url": url}).encode() + b"\n"
+            for url in urls
+        )
+
+        mock_process = AsyncMock()
+        mock_process.returncode = 0
+        mock_process.stdin = MagicMock()
+        mock_process.stdin.drain = AsyncMock()
+        mock_process.stdout = AsyncMock()
+        mock_process.stdout.read = AsyncMock(side_effect=[output, b""])
+        mock_process.wait = AsyncMock()
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process) as mock_exec:
+            results = [m async for m in downloader.get_metadata_batch(urls)]
+            cached = await downloader.get_metadata(urls[1])
+
+        assert [m.title for m in results] == ["a", "b"]
+        assert cached.title == "b"
+        assert mock_exec.call_count == 1
+        mock_process.stdin.write.assert_called_once_with(("\n".join(urls) + "\n").encode())
+
+    @pytest.mark.asyncio
+    async def test_get_metadata_concurrent_calls_share_fetch(self, downloader):
+        """Concurrent lookups for one URL spawn a single yt-dlp process."""
+        mock_process = _metadata_process(json.dumps({"title": "Shared"}).encode(), delay=0.01)
+        url = "https://youtube.com/watch?v=shared"
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process) as mock_exec:
+            results = await asyncio.gather(
+                *(downloader.get_metadata(url) for _ in range(3))
+            )
+
+        assert mock_exec.call_count == 1
+        assert all(r.title == "Shared" for r in results)
+
 
     @pytest.mark.asyncio
     async def test_download_success(self, downloader, tmp_path):
@@ -85,21 +274,14 @@ class TestVideoDownloader:
             b"[download]  50.0% of ~10.00MiB at 1.00MiB/s\n",
             b"[download]  75.0% of ~10.00MiB at 1.00MiB/s\n",
             b"[download] 100.0% of ~10.00MiB at 1.00MiB/s\n",
-            b"",  # EOF
         ]
 
-        line_index = 0
-
-        async def mock_readline():
-            nonlocal line_index
-            if line_index < len(progress_lines):
-                line = progress_lines[line_index]
-                line_index += 1
-                return line
-            return b""
+        # Split mid-line to exercise line reassembly across reads
+        output = b"".join(progress_lines)
+        chunks = [output[i:i + 16] for i in range(0, len(output), 16)] + [b""]
 
         mock_process.stdout = AsyncMock()
-        mock_process.stdout.readline = mock_readline
+        mock_process.stdout.read = AsyncMock(side_effect=chunks)
         mock_process.stderr = AsyncMock()
         mock_process.stderr.read = AsyncMock(return_value=b"")
         mock_process.wait = AsyncMock()
@@ -120,8 +302,130 @@ class TestVideoDownloader:
             )
 
         assert result == output_path
-        assert len(progress_values) > 0
-        assert progress_values[-1] == 100.0
+        assert progress_values == [25.0, 50.0, 75.0, 100.0, 100.0]
+
+    @pytest.mark.asyncio
+    async def test_download_throttles_progress(self, downloader, tmp_path):
+        """Sub-percent updates arriving in a burst are coalesced."""
+        output_path = tmp_path / "video.mp4"
+        output_path.write_bytes(b"fake video content")
+
+        mock_process = AsyncMock()
+        mock_process.returncode = 0
+        mock_process.stdout = AsyncMock()
+        mock_process.stdout.read = AsyncMock(side_effect=[
+            b"[download]  10.0% of ~10.00MiB\n"
+            b"[download]  10.1% of ~10.00MiB\n"
+            b"[download]  10.2% of ~10.00MiB\n"
+            b"[download]  11.0% of ~10.00MiB\n",
+            b"",
+        ])
+        mock_process.wait = AsyncMock()
+
+        progress_values = []
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+            await downloader.download(
+                "https://youtube.com/watch?v=test", output_path, progress_values.append
+            )
+
+        assert progress_values == [10.0, 11.0, 100.0]
+
+    @pytest.mark.asyncio
+    async def test_download_uses_merger_path(self, downloader, tmp_path):
+        """Without --print output, the merged file from the log is used."""
+        output_path = tmp_path / "video.mp4"
+        merged = tmp_path / 'video "cut".mkv'
+        merged.write_bytes(b"merged")
+
+        mock_process = AsyncMock()
+        mock_process.returncode = 0
+        mock_process.stdout = AsyncMock()
+        mock_process.stdout.read = AsyncMock(side_effect=[
+            b"[download] Destination: " + str(tmp_path / "video.f137.mp4").encode() + b"\n"
+            + b'[Merger] Merging formats into "' + str(merged).encode() + b'"\n',
+            b"",
+        ])
+        mock_process.wait = AsyncMock()
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+            result = await downloader.download("https://youtube.com/watch?v=test", output_path)
+
+        assert result == merged
+
+    @pytest.mark.asyncio
+    async def test_download_uses_printed_path(self, downloader, tmp_path):
+        """The path from --print after_move wins over log scraping."""
+        output_path = tmp_path / "video.mp4"
+        merged = tmp_path / "video.mkv"
+        merged.write_bytes(b"merged")
+
+        mock_process = AsyncMock()
+        mock_process.returncode = 0
+        mock_process.stdout = AsyncMock()
+        mock_process.stdout.read = AsyncMock(side_effect=[
+            b"[download] Destination: " + str(tmp_path / "video.f137.mp4").encode() + b"\n"
+            + b"DLVIDEO_PATH:" + str(merged).encode() + b"\n",
+            b"",
+        ])
+        mock_process.wait = AsyncMock()
+
+        verbose_lines = []
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process) as mock_exec:
+            result = await downloader.download(
+                "https://youtube.com/watch?v=test", output_path, verbose_callback=verbose_lines.append
+            )
+
+        assert result == merged
+        assert "--print" in mock_exec.call_args.args
+        # The internal path marker never reaches the user's log
+        assert verbose_lines and not any("DLVIDEO_PATH" in line for line in verbose_lines)
+
+    @pytest.mark.asyncio
+    async def test_download_uses_aria2c_when_available(self, tmp_path):
+        """aria2c is passed to yt-dlp only when installed and enabled."""
+        output_path = tmp_path / "video.mp4"
+        output_path.write_bytes(b"fake video content")
+
+        mock_process = AsyncMock()
+        mock_process.returncode = 0
+        mock_process.stdout = AsyncMock()
+        mock_process.stdout.read = AsyncMock(return_value=b"")
+        mock_process.wait = AsyncMock()
+
+        with patch("shutil.which", return_value="/usr/bin/aria2c"):
+            with_aria2c = VideoDownloader()
+            without_aria2c = VideoDownloader(use_aria2c=False)
+
+        with patch("dl_video.services.downloader._lower_priority"), \
+                patch("asyncio.create_subprocess_exec", return_value=mock_process) as mock_exec:
+            await with_aria2c.download("https://youtube.com/watch?v=test", output_path)
+            assert "aria2c" in mock_exec.call_args.args
+            await without_aria2c.download("https://youtube.com/watch?v=test", output_path)
+            assert "aria2c" not in mock_exec.call_args.args
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="needs posix_fadvise")
+    async def test_download_drops_page_cache_when_enabled(self, tmp_path):
+        """The finished file is fadvised DONTNEED only when opted in."""
+        output_path = tmp_path / "video.mp4"
+        output_path.write_bytes(b"fake video content")
+
+        mock_process = AsyncMock()
+        mock_process.returncode = 0
+        mock_process.stdout = AsyncMock()
+        mock_process.stdout.read = AsyncMock(return_value=b"")
+        mock_process.wait = AsyncMock()
+
+        with patch("dl_video.services.downloader._lower_priority"), \
+                patch("asyncio.create_subprocess_exec", return_value=mock_process), \
+                patch("os.posix_fadvise") as fadvise:
+            await VideoDownloader().download("https://youtube.com/watch?v=test", output_path)
+            fadvise.assert_not_called()
+            await VideoDownloader(drop_cache_after_download=True).download(
+                "https://youtube.com/watch?v=test", output_path
+            )
+
+        assert fadvise.call_args.args[1:] == (0, 0, os.POSIX_FADV_DONTNEED)
 
     @pytest.mark.asyncio
     async def test_download_failure(self, downloader, tmp_path):
@@ -131,11 +435,8 @@ class TestVideoDownloader:
         mock_process = AsyncMock()
         mock_process.returncode = 1
 
-        async def mock_readline():
-            return b""
-
         mock_process.stdout = AsyncMock()
-        mock_process.stdout.readline = mock_readline
+        mock_process.stdout.read = AsyncMock(return_value=b"")
         mock_process.stderr = AsyncMock()
         mock_process.stderr.read = AsyncMock(return_value=b"Download error")
         mock_process.wait = AsyncMock()
@@ -149,11 +450,69 @@ class TestVideoDownloader:
 
         assert "Download failed" in str(exc_info.value)
 
+    def test_find_output_file(self, downloader, tmp_path):
+        """Output lookup prefers known containers and skips format fragments."""
+        output_path = tmp_path / "video_[1].mp4"
+        (tmp_path / "video_[1].f137.mp4").write_bytes(b"fragment")
+        (tmp_path / "other.mkv").write_bytes(b"other")
+        assert downloader._find_output_file(output_path) is None
+
+        (tmp_path / "video_[1]_old.mov").write_bytes(b"older")
+        assert downloader._find_output_file(output_path) == tmp_path / "video_[1]_old.mov"
+
+        (tmp_path / "video_[1].avi").write_bytes(b"video")
+        assert downloader._find_output_file(output_path) == tmp_path / "video_[1].avi"
+
+        (tmp_path / "video_[1].mkv").write_bytes(b"video")
+        assert downloader._find_output_file(output_path) == tmp_path / "video_[1].mkv"
+
+    def test_find_output_file_flv(self, downloader, tmp_path):
+        """An .flv output isn't mistaken for a "<base>.f<id>" format fragment."""
+        output_path = tmp_path / "video.mp4"
+        (tmp_path / "video.flv").write_bytes(b"video")
+        assert downloader._find_output_file(output_path) == tmp_path / "video.flv"
+
+    def test_find_output_file_skips_partial_and_sidecar_files(self, downloader, tmp_path):
+        """Partial downloads are never returned; sidecars don't count as exact."""
+        output_path = tmp_path / "video.mp4"
+        (tmp_path / "video.mp4.part").write_bytes(b"partial")
+        (tmp_path / "video.mp4.ytdl").write_bytes(b"state")
+        assert downloader._find_output_file(output_path) is None
+
+        (tmp_path / "video.info.json").write_bytes(b"{}")
+        (tmp_path / "video.avi").write_bytes(b"video")
+        assert downloader._find_output_file(output_path) == tmp_path / "video.avi"
+
     def test_cancel(self, downloader):
         """Test cancellation sets flag."""
         downloader.cancel()
         assert downloader._cancelled is True
 
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX signals")
+    async def test_cancel_async_interrupts_first(self, downloader):
+        """A process that exits on SIGINT is never sent SIGTERM."""
+        process = await asyncio.create_subprocess_exec("sleep", "10")
+        downloader._process = process
+        with patch.object(process, "terminate") as terminate:
+            await downloader.cancel_async(grace=5)
+
+        assert process.returncode == -signal.SIGINT
+        terminate.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX signals")
+    async def test_cancel_signals_once(self, downloader):
+        """Awaiting a stop after cancel() joins it instead of interrupting again."""
+        process = await asyncio.create_subprocess_exec("sleep", "10")
+        downloader._process = process
+        with patch.object(process, "send_signal", wraps=process.send_signal) as send_signal:
+            downloader.cancel()
+            await downloader.cancel_async()
+
+        assert process.returncode == -signal.SIGINT
+        send_signal.assert_called_once_with(signal.SIGINT)
+
 
 class TestVideoConverter:
     """Tests for VideoConverter service."""
@@ -280,9 +639,11 @@ class TestFileUploader:
     """Tests for FileUploader service."""
 
     @pytest.fixture
-    def uploader(self):
-        """Create a FileUploader instance."""
-        return FileUploader()
+    async def uploader(self):
+        """Create a FileUploader instance with no shared client left over."""
+        FileUploader._client = None
+        yield FileUploader()
+        await FileUploader.aclose()
 
     @pytest.mark.asyncio
     async def test_upload_success(self, uploader, tmp_path):
@@ -312,6 +673,112 @@ class TestFileUploader:
         assert len(progress_values) > 0
         assert progress_values[-1] == 100.0
 
+    @pytest.mark.asyncio
+    async def test_upload_reports_byte_progress(self, uploader, tmp_path):
+        """The body is streamed as multipart and progress follows bytes sent."""
+        file_path = tmp_path / "video.mp4"
+        file_path.write_bytes(b"x" * 300_000)
+        uploader.CHUNK_SIZE = 65536
+        received = []
+
+        async def handler(request):
+            body = b"".join([chunk async for chunk in request.stream])
+            assert len(body) == int(request.headers["Content-Length"])
+            boundary = request.headers["Content-Type"].partition("boundary=")[2]
+            assert body.startswith(f"--{boundary}\r\n".encode())
+            assert body.endswith(f"\r\n--{boundary}--\r\n".encode())
+            assert b'filename="video.mp4"' in body
+            received.append(body)
+            return httpx.Response(200, text="https://jonesfilesandfootmassage.com/u/abc.mp4")
+
+        real_client = httpx.AsyncClient
+        progress_values = []
+        with patch(
+            "httpx.AsyncClient",
+            side_effect=lambda **kw: real_client(transport=httpx.MockTransport(handler), **kw),
+        ):
+            await uploader.upload(file_path, progress_values.append)
+
+        assert b"x" * 300_000 in received[0]
+        assert progress_values[0] == 0.0
+        assert progress_values[-1] == 100.0
+        assert progress_values == sorted(progress_values)
+        assert 0.0 < progress_values[-2] < 100.0
+
+    @pytest.mark.parametrize("filename", ["video.mp4", "clip.webm", 'we"ird\\name\x01\x1b.bin'])
+    def test_multipart_envelope_matches_httpx(self, filename):
+        """The hand-built envelope is byte-for-byte what httpx's files= sends."""
+        head, tail = _multipart_envelope("boundary123", filename)
+        request = httpx.Request(
+            "POST",
+            "https://example.com/",
+            files={"file": (filename, b"DATA")},
+            headers={"Content-Type": "multipart/form-data; boundary=boundary123"},
+        )
+        assert request.read() == head + b"DATA" + tail
+
+    @pytest.mark.asyncio
+    async def test_upload_retries_dropped_connection(self, uploader, tmp_path):
+        """A dropped connection re-sends the whole body."""
+        file_path = tmp_path / "video.mp4"
+        file_path.write_bytes(b"x" * 1000)
+        uploader.RETRY_BACKOFF = 0
+        attempts = []
+
+        async def handler(request):
+            attempts.append(b"".join([chunk async for chunk in request.stream]))
+            if len(attempts) == 1:
+                raise httpx.ConnectError("connection reset")
+            return httpx.Response(200, text="https://jonesfilesandfootmassage.com/u/abc.mp4")
+
+        real_client = httpx.AsyncClient
+        with patch(
+            "httpx.AsyncClient",
+            side_effect=lambda **kw: real_client(transport=httpx.MockTransport(handler), **kw),
+        ):
+            url = await uploader.upload(file_path)
+
+        assert url == "https://jonesfilesandfootmassage.com/u/abc.mp4"
+        assert len(attempts) == 2
+        assert attempts[0] == attempts[1]
+
+    @pytest.mark.asyncio
+    async def test_upload_reuses_client(self, uploader, tmp_path):
+        """Uploads from separate instances share one HTTP client."""
+        file_path = tmp_path / "video.mp4"
+        file_path.write_bytes(b"fake video content")
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = "https://jonesfilesandfootmassage.com/u/abc123.mp4"
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.is_closed = False
+            mock_client.post = AsyncMock(return_value=mock_response)
+            mock_client_class.return_value = mock_client
+
+            await uploader.upload(file_path)
+            await FileUploader().upload(file_path)
+
+        assert mock_client_class.call_count == 1
+        assert mock_client.post.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_context_manager_keeps_shared_client(self, uploader):
+        """Leaving one uploader's context leaves the client open for others."""
+        async with FileUploader():
+            async with uploader:
+                client = FileUploader._get_client()
+            assert not client.is_closed
+            assert FileUploader._get_client() is client
+
+        assert not client.is_closed
+
+        await FileUploader.aclose()
+        assert client.is_closed
+        assert FileUploader._client is None
+
     @pytest.mark.asyncio
     async def test_upload_file_not_found(self, uploader, tmp_path):
         """Test upload with missing file."""
@@ -358,8 +825,6 @@ class TestFileUploader:
     @pytest.mark.asyncio
     async def test_upload_timeout(self, uploader, tmp_path):
         """Test upload timeout."""
-        import httpx
-
         file_path = tmp_path / "video.mp4"
         file_path.write_bytes(b"fake video content")
 
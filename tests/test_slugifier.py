@@ -8,7 +8,7 @@ Validates: Requirements 2.4
 
 import re
 
-from hypothesis import given, settings
+from hypothesis import given
 from hypothesis import strategies as st
 
 from dl_video.utils.slugifier import Slugifier
@@ -22,7 +22,6 @@ class TestSlugifierProperties:
         self.slugifier = Slugifier()
 
     @given(st.text())
-    @settings(max_examples=100)
     def test_slugification_idempotence(self, text: str) -> None:
         """Property 2: Slugification Idempotence.
 
@@ -36,7 +35,6 @@ class TestSlugifierProperties:
         assert once == twice, f"Idempotence failed: slugify('{text}') = '{once}', slugify('{once}') = '{twice}'"
 
     @given(st.text())
-    @settings(max_examples=100)
     def test_slugification_character_constraints(self, text: str) -> None:
         """Property 3: Slugification Character Constraints.
 
@@ -63,3 +61,9 @@ class TestSlugifierProperties:
             assert not result.endswith("_"), (
                 f"Trailing underscore in slugified output: '{result}' from input '{text}'"
             )
+
+    @given(st.text(alphabet=st.characters(max_codepoint=127)))
+    def test_ascii_fast_path_matches_regex(self, text: str) -> None:
+        """The str.translate path for ASCII input gives the regex result."""
+        expected = re.sub(r"[^a-z0-9]+", "_", text.lower()).strip("_")
+        assert self.slugifier.slugify(text) == expected
@@ -5,7 +5,7 @@
 """
 
 import pytest
-from hypothesis import given, strategies as st, assume, settings
+from hypothesis import given, strategies as st
 
 from dl_video.models import OperationState
 from dl_video.state_machine import (
@@ -23,7 +23,6 @@ class TestOperationStateMachineProperties:
     """Property-based tests for OperationStateMachine."""
 
     @given(st.lists(state_strategy, min_size=1, max_size=20))
-    @settings(max_examples=100)
     def test_state_transitions_only_valid_paths(
         self, state_sequence: list[OperationState]
     ) -> None:
@@ -55,8 +54,7 @@ class TestOperationStateMachineProperties:
                 # State should remain unchanged
                 assert sm.state == current_state
 
-    @given(state_strategy)
-    @settings(max_examples=100)
+    @pytest.mark.parametrize("target_state", list(OperationState))
     def test_can_transition_to_consistency(self, target_state: OperationState) -> None:
         """
         *For any* target state, can_transition_to() SHALL return True if and only
@@ -208,6 +206,17 @@ class TestOperationStateMachineProperties:
         
         assert sm.history == expected_history
 
+    def test_history_view_is_live_and_snapshot_is_not(self) -> None:
+        """history follows later transitions; history_snapshot() keeps its contents."""
+        sm = OperationStateMachine()
+        view = sm.history
+        snapshot = sm.history_snapshot()
+
+        sm.transition_to(OperationState.FETCHING_METADATA)
+
+        assert list(view) == [OperationState.IDLE, OperationState.FETCHING_METADATA]
+        assert snapshot == (OperationState.IDLE,)
+
     def test_is_active_returns_true_for_active_states(self) -> None:
         """Test is_active() returns True for active states."""
         sm = OperationStateMachine()
@@ -0,0 +1,85 @@
+"""Tests for ThumbnailCache."""
+
+import hashlib
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from dl_video.utils.thumbnail_cache import ThumbnailCache
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_state():
+    """The decoded-image LRU and legacy-name scans are shared by all instances."""
+    ThumbnailCache._images.clear()
+    yield
+    ThumbnailCache._images.clear()
+    ThumbnailCache._legacy_names.clear()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ThumbnailCache(tmp_path / "thumbnails")
+
+
+class TestThumbnailCache:
+    """Tests for ThumbnailCache."""
+
+    def test_get_returns_independent_copies(self, cache):
+        """Modifying a returned image affects neither the cache nor other callers."""
+        url = "https://i.ytimg.com/vi/abc/maxresdefault.jpg"
+        original = Image.new("RGB", (4, 4), "red")
+        cache.save(url, original)
+        original.putpixel((0, 0), (0, 0, 255))
+
+        first = cache.get(url)
+        first.putpixel((0, 0), (0, 255, 0))
+        second = cache.get(url)
+
+        assert first is not second
+        assert second.getpixel((0, 0)) == (255, 0, 0)
+
+    def test_memory_cache_evicts_least_recently_used(self, cache):
+        """Only the MEMORY_CACHE_SIZE most recently used images stay decoded."""
+        urls = [f"https://example.com/{i}.jpg" for i in range(ThumbnailCache.MEMORY_CACHE_SIZE + 1)]
+        for url in urls:
+            cache.save(url, Image.new("RGB", (1, 1)))
+            # Touch the first image so the second one becomes the oldest
+            cache.get(urls[0])
+
+        cached = ThumbnailCache._images
+        assert len(cached) == ThumbnailCache.MEMORY_CACHE_SIZE
+        assert cache.get_path(urls[0]) in cached
+        assert cache.get_path(urls[1]) not in cached
+        assert cache.get_path(urls[-1]) in cached
+
+        # Evicted images are still read back from disk
+        assert cache.get(urls[1]) is not None
+
+    def test_legacy_file_migrated_once(self, cache, tmp_path, monkeypatch):
+        """A file under an old name is found and renamed exactly once."""
+        url = "https://i.ytimg.com/vi/old/hqdefault.jpg"
+        legacy_name = hashlib.md5(url.encode()).hexdigest() + ".png"
+        cache_dir = tmp_path / "thumbnails"
+        cache_dir.mkdir()
+        Image.new("RGB", (2, 2), "blue").save(cache_dir / legacy_name)
+
+        renames = []
+        original_rename = Path.rename
+
+        def counting_rename(self, target):
+            renames.append(self.name)
+            return original_rename(self, target)
+
+        monkeypatch.setattr(Path, "rename", counting_rename)
+
+        assert cache.has(url)
+        assert cache.get(url).getpixel((0, 0)) == (0, 0, 255)
+        assert not (cache_dir / legacy_name).exists()
+
+        # Later misses, from any instance, try no renames
+        other = ThumbnailCache(cache_dir)
+        assert not other.has("https://example.com/missing.jpg")
+        assert other.get("https://example.com/missing.jpg") is None
+        assert renames == [legacy_name]
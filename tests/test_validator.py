@@ -5,10 +5,10 @@ Property 1: URL Validation Consistency - same input always produces same result
 Validates: Requirements 1.2, 1.3
 """
 
-from hypothesis import given, settings
+from hypothesis import given
 from hypothesis import strategies as st
 
-from dl_video.utils.validator import URLValidator, ValidationResult
+from dl_video.utils.validator import URLValidator, ValidationResult, _patterns_by_host
 
 
 class TestURLValidatorProperties:
@@ -19,7 +19,6 @@ class TestURLValidatorProperties:
         self.validator = URLValidator()
 
     @given(st.text())
-    @settings(max_examples=100)
     def test_url_validation_consistency(self, url: str) -> None:
         """Property 1: URL Validation Consistency.
 
@@ -48,7 +47,6 @@ class TestURLValidatorProperties:
         )
 
     @given(st.text())
-    @settings(max_examples=100)
     def test_validation_result_has_message(self, url: str) -> None:
         """Validation result always has a non-empty message.
 
@@ -59,3 +57,15 @@ class TestURLValidatorProperties:
         # Message should always be a non-empty string
         assert isinstance(result.message, str)
         assert len(result.message) > 0, f"Empty message for URL '{url}'"
+
+
+def test_patterns_sharing_a_host_all_match() -> None:
+    """A second pattern for the same host doesn't replace the first."""
+    patterns = _patterns_by_host([
+        r"https?://(www\.)?youtube\.com/watch\?v=[\w-]+",
+        r"https?://(www\.)?youtube\.com/shorts/[\w-]+",
+    ])
+
+    assert list(patterns) == ["youtube.com"]
+    assert patterns["youtube.com"].match("https://www.youtube.com/watch?v=abc")
+    assert patterns["youtube.com"].match("https://youtube.com/shorts/abc")